@@ -5,12 +5,21 @@
 CloudWatch tools for error analysis.
 """
 
+import contextvars
+import copy
+import functools
+import itertools
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 
 import boto3
+from botocore.config import Config
 from strands import tool
 
 from ..config import create_error_response
@@ -19,6 +28,184 @@ from .xray_tool import extract_lambda_request_ids
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent FilterLogEvents calls, kept below the CloudWatch
+# Logs per-account TPS quota so parallel searches do not get throttled.
+MAX_CONCURRENT_LOG_SEARCHES = 5
+
+# Once this many error events are found for a request ID, the remaining log
+# groups are unlikely to add anything useful and are no longer searched.
+EARLY_STOP_EVENT_THRESHOLD = 5
+
+# CloudWatch Logs Insights accepts at most 50 log groups per StartQuery call
+# and returns at most 10,000 rows per query.
+INSIGHTS_MAX_LOG_GROUPS_PER_QUERY = 50
+INSIGHTS_MAX_RESULTS = 10000
+INSIGHTS_POLL_INTERVAL_SECONDS = 0.25
+INSIGHTS_MAX_POLL_INTERVAL_SECONDS = 2.0
+INSIGHTS_QUERY_TIMEOUT_SECONDS = 60
+
+# Upper bound on the number of time buckets in the system-wide error timeline
+INSIGHTS_MAX_TIMELINE_BINS = 96
+
+# Terms marking a message as an error in the document-specific fallback,
+# matched case-insensitively in one pass. The same alternation is pushed down
+# to CloudWatch as an Insights filter.
+_DOCUMENT_ERROR_TERMS = "ERROR|EXCEPTION|FAILED|TIMEOUT"
+_DOCUMENT_ERROR_PATTERN = re.compile(_DOCUMENT_ERROR_TERMS, re.IGNORECASE)
+_DOCUMENT_ERROR_INSIGHTS_FILTER = f"@message like /(?i){_DOCUMENT_ERROR_TERMS}/"
+
+# FilterLogEvents syntax (term separators, quotes, ?term alternatives, JSON and
+# space-delimited patterns) that a Logs Insights substring match cannot mirror
+_FILTER_PATTERN_SYNTAX = re.compile(r'[\s"?{}\[\]]')
+
+# Maximum FilterLogEvents pages fetched per log group search, and consecutive
+# pages without a usable event after which a sparse log group is given up on
+MAX_FILTER_LOG_EVENTS_PAGES = 10
+MAX_EMPTY_FILTER_LOG_EVENTS_PAGES = 3
+
+# Error filter patterns whose searches over-fetch to make up for the INFO and
+# system lines that _should_exclude_log_event drops afterwards
+_ERROR_FILTER_PATTERNS = frozenset(
+    {"[ERROR]", "[WARN]", "ERROR:", "WARN:", "Exception", "Failed"}
+)
+
+# Log lines starting with these are skipped when searching for errors
+_SYSTEM_LOG_PREFIXES = (
+    "[INFO]",
+    "INIT_START",
+    "START",
+    "END",
+    "REPORT",
+    "Config:",
+    "Debug:",
+    "Trace:",
+)
+
+# Log lines containing any of these are treated as noise
+_EXCLUDE_CONTENT = ('"sample_json"', "Processing event:", "Initialized", "Starting")
+
+# The _EXCLUDE_CONTENT terms are matched anywhere in a message, so most of them
+# can be excluded in the FilterLogEvents pattern itself. Prefix-only checks
+# (START, END, [INFO], ...) cannot be expressed there.
+_FILTER_PATTERN_EXCLUSIONS = ('-"Processing event:"', "-Initialized", "-Starting")
+
+# Log group discovery results rarely change during a Lambda container's
+# lifetime, so they are reused for this many seconds before being refreshed.
+LOG_GROUP_CACHE_TTL_SECONDS = 300
+
+# Adaptive retries back off client-side when CloudWatch Logs throttles the
+# concurrent searches instead of failing them outright.
+_BOTO_CONFIG = Config(retries={"max_attempts": 10, "mode": "adaptive"})
+
+# Document context (tracking record plus X-Ray request IDs) is reused across
+# agent turns about the same document for this many seconds.
+DOCUMENT_CONTEXT_CACHE_TTL_SECONDS = 120
+
+# Document statuses after which the tracking record no longer changes
+_TERMINAL_DOCUMENT_STATUSES = frozenset({"COMPLETED", "FAILED"})
+
+# FilterLogEvents results memoized for the duration of one tool invocation, so
+# overlapping search tiers do not repeat identical CloudWatch calls
+_search_memo: contextvars.ContextVar[Optional[Dict[tuple, Dict[str, Any]]]] = (
+    contextvars.ContextVar("_search_memo", default=None)
+)
+
+# Error indicators matched case-insensitively in a single pass over a message
+_ERROR_INDICATOR_PATTERN = re.compile(
+    r"\[ERROR\]|ERROR:|EXCEPTION|FAILED|TIMEOUT|FATAL|CRITICAL", re.IGNORECASE
+)
+
+
+@functools.cache
+def _get_logs_client():
+    """
+    Get the shared CloudWatch Logs client, created on first use.
+    """
+    return boto3.client("logs", config=_BOTO_CONFIG)
+
+
+@functools.cache
+def _get_cloudformation_client():
+    """
+    Get the shared CloudFormation client, created on first use.
+    """
+    return boto3.client("cloudformation", config=_BOTO_CONFIG)
+
+
+def _is_cacheable_lookup(result: Dict[str, Any]) -> bool:
+    """
+    Check whether a log group lookup result may be cached.
+
+    Error responses and empty log group listings are never cached so transient
+    failures and newly created log groups are picked up on the next call.
+    """
+    return "error" not in result and result.get("log_groups_found") != 0
+
+
+def _ttl_cache(
+    ttl_seconds: float,
+    maxsize: int = 128,
+    should_cache: Callable[[Dict[str, Any]], bool] = _is_cacheable_lookup,
+) -> Callable[[Callable[..., Dict[str, Any]]], Callable[..., Dict[str, Any]]]:
+    """
+    Cache a lookup helper's responses in-process for ttl_seconds.
+
+    Only responses accepted by should_cache are stored, and the oldest entry is
+    evicted once maxsize entries are held. Cached responses are copied so
+    callers cannot mutate shared state.
+    """
+
+    def decorator(
+        func: Callable[..., Dict[str, Any]],
+    ) -> Callable[..., Dict[str, Any]]:
+        cache: Dict[Any, tuple] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+            if entry is not None and now - entry[0] < ttl_seconds:
+                return copy.deepcopy(entry[1])
+
+            result = func(*args, **kwargs)
+            if should_cache(result):
+                with lock:
+                    cache.pop(key, None)
+                    if len(cache) >= maxsize:
+                        cache.pop(next(iter(cache)))
+                    cache[key] = (now, copy.deepcopy(result))
+            return result
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def _is_cacheable_document_context(context: Dict[str, Any]) -> bool:
+    """
+    Check whether a document context may be cached.
+
+    A missing tracking record is cached, and so is a found one once the document
+    has finished processing. Failed lookups, documents still in progress (whose
+    status and Lambda request IDs keep changing) and traces whose request IDs
+    could not be extracted yet are not.
+    """
+    if "error" in context:
+        return bool(context.get("tracking_available"))
+    document_record = context.get("document_record") or {}
+    document_status = document_record.get("ObjectStatus") or document_record.get(
+        "WorkflowStatus"
+    )
+    if document_status not in _TERMINAL_DOCUMENT_STATUSES:
+        return False
+    return not context.get("xray_trace_id") or bool(
+        context.get("lambda_function_to_request_id_map")
+    )
+
 
 # =============================================================================
 # PUBLIC TOOL FUNCTIONS
@@ -56,6 +243,7 @@ def search_cloudwatch_logs(
     Returns:
         Dict containing error events, search metadata, and processing context
     """
+    memo_token = _search_memo.set({})
     try:
         # Parameters already have proper defaults, no conversion needed
 
@@ -73,6 +261,8 @@ def search_cloudwatch_logs(
     except Exception as e:
         logger.error(f"CloudWatch log search failed: {e}")
         return create_error_response(str(e), document_id=document_id, events_found=0)
+    finally:
+        _search_memo.reset(memo_token)
 
 
 # =============================================================================
@@ -115,6 +305,37 @@ def _search_document_logs(
     # Get stack name from document context
     actual_stack_name = _get_stack_name(context.get("document_record"))
 
+    # Calculate processing time window with buffer
+    time_window = _get_processing_time_window(context["document_record"])
+
+    # Get prioritized request IDs for search
+    request_ids_info = _prioritize_request_ids(
+        context["document_record"], context["lambda_function_to_request_id_map"]
+    )
+
+    # For failed documents, search the failed function's log group directly
+    # and only fall back to log group discovery if it has no matching errors
+    failed_function_log_group = _get_function_log_group_name(
+        actual_stack_name, request_ids_info.get("primary_failed_function") or ""
+    )
+    if failed_function_log_group:
+        search_results = _search_by_request_ids(
+            request_ids_info,
+            context["lambda_function_to_request_id_map"],
+            [{"name": failed_function_log_group}],
+            time_window,
+            max_log_events,
+        )
+        if search_results["total_events"] > 0:
+            return _build_response(
+                document_id,
+                context["document_record"],
+                context["xray_trace_id"],
+                actual_stack_name,
+                context["lambda_function_to_request_id_map"],
+                search_results,
+            )
+
     # Get log groups for the stack
     log_groups = _get_log_groups_from_stack_prefix(actual_stack_name)
     if log_groups.get("log_groups_found", 0) == 0:
@@ -124,19 +345,19 @@ def _search_document_logs(
             "message": f"No log groups found for stack {actual_stack_name}",
         }
 
-    # Calculate processing time window with buffer
-    time_window = _get_processing_time_window(context["document_record"])
-
-    # Get prioritized request IDs for search
-    request_ids_info = _prioritize_request_ids(
-        context["document_record"], context["lambda_function_to_request_id_map"]
+    # Search the failed function's log groups first, then the other traced
+    # functions, so the group limits below keep the most relevant ones
+    ranked_log_groups = _rank_log_groups(
+        log_groups["log_groups"],
+        context["lambda_function_to_request_id_map"],
+        request_ids_info.get("primary_failed_function"),
     )
 
     # Primary search using Lambda request IDs
     search_results = _search_by_request_ids(
         request_ids_info,
         context["lambda_function_to_request_id_map"],
-        log_groups["log_groups"][:max_log_groups],
+        ranked_log_groups[:max_log_groups],
         time_window,
         max_log_events,
     )
@@ -145,7 +366,7 @@ def _search_document_logs(
     if search_results["total_events"] == 0:
         search_results = _search_by_document_fallback(
             document_id,
-            log_groups["log_groups"][:3],
+            ranked_log_groups[:3],
             time_window,
             max_log_events,
         )
@@ -189,33 +410,69 @@ def _search_stack_logs(
             "message": "No log groups found",
         }
 
-    # Search each log group
+    # Search all log groups with Logs Insights, falling back to per-group
+    # FilterLogEvents calls for patterns Insights cannot express or if the
+    # queries cannot be run
     groups_to_search = log_groups["log_groups"][:max_log_groups]
+    log_group_names = [log_group["name"] for log_group in groups_to_search]
     all_results = []
     total_events = 0
 
-    for log_group in groups_to_search:
-        search_result = _search_cloudwatch_logs(
-            log_group_name=log_group["name"],
+    search_end = datetime.now()
+    search_start = search_end - timedelta(hours=hours_back)
+    search_results = None
+    error_counts = None
+    if _insights_literal(filter_pattern) is not None:
+        try:
+            # Error counts come from a separate stats query run alongside the
+            # sample queries, so both finish in roughly one query's time
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                counts_future = executor.submit(
+                    _get_insights_error_counts,
+                    log_group_names,
+                    filter_pattern,
+                    search_start,
+                    search_end,
+                )
+                search_results = _search_log_groups_with_insights(
+                    log_group_names,
+                    filter_pattern=filter_pattern,
+                    start_time=search_start,
+                    end_time=search_end,
+                    max_events=max_log_events,
+                )
+                error_counts = counts_future.result()
+        except Exception as e:
+            logger.warning(
+                f"Logs Insights search failed, falling back to FilterLogEvents: {e}"
+            )
+
+    if search_results is None:
+        search_results = _search_log_groups_concurrently(
+            log_group_names,
             filter_pattern=filter_pattern,
             hours_back=hours_back,
             max_events=max_log_events,
         )
 
+    for log_group, search_result in zip(groups_to_search, search_results):
         if search_result.get("events_found", 0) > 0:
             logger.info(
                 f"Found {search_result['events_found']} error events in {log_group['name']}"
             )
-            all_results.append(
-                {
-                    "log_group": log_group["name"],
-                    "events_found": search_result["events_found"],
-                    "events": search_result["events"],
-                }
-            )
+            group_result = {
+                "log_group": log_group["name"],
+                "events_found": search_result["events_found"],
+                "events": search_result["events"],
+            }
+            if error_counts is not None:
+                group_result["total_matches"] = error_counts["by_log_group"].get(
+                    log_group["name"], 0
+                )
+            all_results.append(group_result)
             total_events += search_result["events_found"]
 
-    return {
+    response = {
         "analysis_type": "system_wide",
         "stack_name": stack_name,
         "filter_pattern": filter_pattern,
@@ -223,6 +480,9 @@ def _search_stack_logs(
         "log_groups_searched": len(groups_to_search),
         "results": all_results,
     }
+    if error_counts is not None:
+        response["error_timeline"] = error_counts["timeline"]
+    return response
 
 
 # =============================================================================
@@ -230,6 +490,11 @@ def _search_stack_logs(
 # =============================================================================
 
 
+@_ttl_cache(
+    DOCUMENT_CONTEXT_CACHE_TTL_SECONDS,
+    maxsize=256,
+    should_cache=_is_cacheable_document_context,
+)
 def _get_document_context(document_id: str) -> Dict[str, Any]:
     """
     Get document context from DynamoDB and extract X-Ray information.
@@ -241,6 +506,7 @@ def _get_document_context(document_id: str) -> Dict[str, Any]:
             "document_id": document_id,
             "error": dynamodb_response.get("reason", "Document not found"),
             "events_found": 0,
+            "tracking_available": dynamodb_response.get("tracking_available", False),
         }
 
     document_record = dynamodb_response.get("document", {})
@@ -290,13 +556,9 @@ def _get_processing_time_window(document_record: Dict[str, Any]) -> Dict[str, An
     end_time = None
 
     if document_record.get("InitialEventTime"):
-        start_time = datetime.fromisoformat(
-            document_record["InitialEventTime"].replace("Z", "+00:00")
-        )
+        start_time = _parse_iso_timestamp(document_record["InitialEventTime"])
     if document_record.get("CompletionTime"):
-        end_time = datetime.fromisoformat(
-            document_record["CompletionTime"].replace("Z", "+00:00")
-        )
+        end_time = _parse_iso_timestamp(document_record["CompletionTime"])
 
     # Add time buffer for isolation
     if start_time and end_time:
@@ -308,6 +570,18 @@ def _get_processing_time_window(document_record: Dict[str, Any]) -> Dict[str, An
     return {"start_time": start_time, "end_time": end_time}
 
 
+def _parse_iso_timestamp(timestamp: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, accepting a trailing "Z" for UTC.
+
+    datetime.fromisoformat only understands "Z" from Python 3.11, so the suffix
+    is swapped for "+00:00" without scanning the rest of the string.
+    """
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    return datetime.fromisoformat(timestamp)
+
+
 def _prioritize_request_ids(
     document_record: Dict[str, Any], lambda_function_to_request_id_map: Dict[str, str]
 ) -> Dict[str, Any]:
@@ -318,6 +592,7 @@ def _prioritize_request_ids(
         "WorkflowStatus"
     )
     request_ids_to_search = list(lambda_function_to_request_id_map.values())
+    primary_failed_function = None
 
     # Prioritize failed function if document failed
     if document_status == "FAILED" and lambda_function_to_request_id_map:
@@ -332,9 +607,41 @@ def _prioritize_request_ids(
     return {
         "document_status": document_status,
         "request_ids_to_search": request_ids_to_search,
+        "primary_failed_function": primary_failed_function,
     }
 
 
+def _rank_log_groups(
+    log_groups: List[Dict[str, Any]],
+    lambda_function_to_request_id_map: Dict[str, str],
+    primary_failed_function: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Order log groups by how likely they are to hold the document's errors.
+
+    Log groups matching the failed Lambda function come first, then those
+    matching any other traced function, then the rest in their original order.
+    """
+    primary_type = _extract_function_type(primary_failed_function or "").lower()
+    traced_types = {
+        function_type.lower()
+        for function_type in map(
+            _extract_function_type, lambda_function_to_request_id_map
+        )
+        if function_type
+    }
+
+    def priority(log_group: Dict[str, Any]) -> int:
+        name = log_group["name"].lower()
+        if primary_type and primary_type in name:
+            return 0
+        if any(function_type in name for function_type in traced_types):
+            return 1
+        return 2
+
+    return sorted(log_groups, key=priority)
+
+
 def _search_by_request_ids(
     request_ids_info: Dict[str, Any],
     lambda_function_to_request_id_map: Dict[str, str],
@@ -344,20 +651,26 @@ def _search_by_request_ids(
 ) -> Dict[str, Any]:
     """
     Search logs using Lambda request IDs with function-specific targeting.
+
+    Request IDs are searched in priority order, each with its own Logs Insights
+    queries and row limit, falling back to FilterLogEvents calls when Insights
+    finds nothing for a request ID or cannot be run. Results are reported for
+    the highest-priority request ID that has error events.
     """
     all_results = []
     total_events = 0
     search_method_used = "none"
 
+    # Reverse lookup so each request ID resolves to its function in O(1).
+    # Reversed insertion order keeps the first function for duplicate IDs.
+    request_id_to_function_name = {
+        rid: func for func, rid in reversed(lambda_function_to_request_id_map.items())
+    }
+
+    # Resolve the log groups to search for each request ID, in priority order
+    search_plan = []
     for request_id in request_ids_info["request_ids_to_search"]:
-        function_name = next(
-            (
-                func
-                for func, rid in lambda_function_to_request_id_map.items()
-                if rid == request_id
-            ),
-            "Unknown",
-        )
+        function_name = request_id_to_function_name.get(request_id, "Unknown")
 
         function_type = _extract_function_type(function_name)
         matching_log_groups = (
@@ -375,36 +688,97 @@ def _search_by_request_ids(
                 logger.info(
                     f"Searching log group {log_group['name']} for Lambda function {function_name} ({function_type}) with request ID {request_id}"
                 )
-                search_result = _search_cloudwatch_logs(
-                    log_group_name=log_group["name"],
-                    filter_pattern="ERROR",
-                    max_events=max_log_events * 3,
-                    start_time=time_window.get("start_time"),
-                    end_time=time_window.get("end_time"),
-                    request_id=request_id,
-                )
-
-                if search_result.get("events_found", 0) > 0:
-                    search_method_used = "lambda_request_id"
-                    logger.info(
-                        f"Found {search_result['events_found']} error events in {log_group['name']} for Lambda function {function_name} using request ID {request_id}"
-                    )
-                    all_results.append(
-                        {
-                            "log_group": log_group["name"],
-                            "lambda_function_name": function_name,
-                            "request_id": request_id,
-                            "search_method": "lambda_request_id",
-                            "events_found": search_result["events_found"],
-                            "events": search_result["events"],
-                        }
-                    )
-                    total_events += search_result["events_found"]
+            search_plan.append((request_id, function_name, matching_log_groups))
         else:
             logger.info(
                 f"No matching log group found for Lambda function {function_name} ({function_type})"
             )
 
+    if not search_plan:
+        return {
+            "all_results": all_results,
+            "total_events": total_events,
+            "search_method_used": search_method_used,
+        }
+
+    max_events_per_request_id = max_log_events * 3
+    early_stop_threshold = min(max_log_events, EARLY_STOP_EVENT_THRESHOLD)
+    search_start, search_end = _resolve_time_window(time_window)
+    use_insights = True
+
+    # Narrow the scan to the log streams Lambda created on the processing day
+    log_stream_name_prefix = _get_lambda_log_stream_prefix(
+        time_window.get("start_time"), time_window.get("end_time")
+    )
+
+    for request_id, function_name, matching_log_groups in search_plan:
+        matching_log_group_names = [lg["name"] for lg in matching_log_groups]
+        search_results = None
+        if use_insights:
+            try:
+                search_results = _search_log_groups_with_insights(
+                    matching_log_group_names,
+                    filter_pattern="ERROR",
+                    start_time=search_start,
+                    end_time=search_end,
+                    max_events=max_events_per_request_id,
+                    extra_filters=[_insights_message_filter(request_id)],
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Logs Insights request ID search failed, using FilterLogEvents: {e}"
+                )
+                use_insights = False
+
+        if search_results is None or not any(
+            r.get("events_found", 0) > 0 for r in search_results
+        ):
+            search_kwargs = {
+                "filter_pattern": "ERROR",
+                "max_events": max_events_per_request_id,
+                "start_time": time_window.get("start_time"),
+                "end_time": time_window.get("end_time"),
+                "request_id": request_id,
+            }
+            search_results = _search_log_groups_concurrently(
+                matching_log_group_names,
+                stop_after_events=early_stop_threshold,
+                log_stream_name_prefix=log_stream_name_prefix,
+                **search_kwargs,
+            )
+            if log_stream_name_prefix and not any(
+                r.get("events_found", 0) > 0 for r in search_results
+            ):
+                # The function may have run in a warm environment whose log
+                # stream is dated before the processing day
+                search_results = _search_log_groups_concurrently(
+                    matching_log_group_names,
+                    stop_after_events=early_stop_threshold,
+                    **search_kwargs,
+                )
+
+        request_id_events = 0
+        for log_group, search_result in zip(matching_log_groups, search_results):
+            if request_id_events >= early_stop_threshold:
+                break
+            if search_result.get("events_found", 0) > 0:
+                search_method_used = "lambda_request_id"
+                logger.info(
+                    f"Found {search_result['events_found']} error events in {log_group['name']} for Lambda function {function_name} using request ID {request_id}"
+                )
+                all_results.append(
+                    {
+                        "log_group": log_group["name"],
+                        "lambda_function_name": function_name,
+                        "request_id": request_id,
+                        "search_method": "lambda_request_id",
+                        "events_found": search_result["events_found"],
+                        "events": search_result["events"],
+                    }
+                )
+                total_events += search_result["events_found"]
+                request_id_events += search_result["events_found"]
+
         # Stop if we found errors from the first (likely failed) function
         if total_events > 0:
             break
@@ -416,6 +790,20 @@ def _search_by_request_ids(
     }
 
 
+def _resolve_time_window(time_window: Dict[str, Any], hours_back: int = 24) -> tuple:
+    """
+    Get (start, end) for a processing time window, defaulting to the last
+    hours_back hours when the window is incomplete.
+    """
+    start_time = time_window.get("start_time")
+    end_time = time_window.get("end_time")
+    if start_time is not None and end_time is not None:
+        return start_time, end_time
+
+    search_end = datetime.now()
+    return search_end - timedelta(hours=hours_back), search_end
+
+
 def _search_by_document_fallback(
     document_id: str,
     groups_to_search: List[Dict[str, Any]],
@@ -431,41 +819,58 @@ def _search_by_document_fallback(
 
     doc_identifier = document_id.replace(".pdf", "").replace(".", "-")
 
-    for log_group in groups_to_search:
-        search_result = _search_cloudwatch_logs(
-            log_group_name=log_group["name"],
+    # Let Logs Insights match the document identifier and the error terms
+    # server-side across the candidate log groups
+    search_start, search_end = _resolve_time_window(time_window)
+    try:
+        insights_results = _search_log_groups_with_insights(
+            [log_group["name"] for log_group in groups_to_search],
             filter_pattern=doc_identifier,
+            start_time=search_start,
+            end_time=search_end,
             max_events=max_log_events,
-            start_time=time_window.get("start_time"),
-            end_time=time_window.get("end_time"),
+            extra_filters=[_DOCUMENT_ERROR_INSIGHTS_FILTER],
+        )
+    except Exception as e:
+        logger.warning(
+            f"Logs Insights fallback search failed, using FilterLogEvents: {e}"
         )
+        insights_results = None
+
+    for index, log_group in enumerate(groups_to_search):
+        if insights_results is not None:
+            error_events = insights_results[index].get("events", [])
+        else:
+            search_result = _search_cloudwatch_logs(
+                log_group_name=log_group["name"],
+                filter_pattern=doc_identifier,
+                max_events=max_log_events,
+                start_time=time_window.get("start_time"),
+                end_time=time_window.get("end_time"),
+            )
 
-        if search_result.get("events_found", 0) > 0:
             # Filter for actual errors
             error_events = [
                 e
                 for e in search_result.get("events", [])
-                if any(
-                    term in e.get("message", "").upper()
-                    for term in ["ERROR", "EXCEPTION", "FAILED", "TIMEOUT"]
-                )
+                if _DOCUMENT_ERROR_PATTERN.search(e.get("message", ""))
             ]
 
-            if error_events:
-                search_method_used = "document_specific_fallback"
-                logger.info(
-                    f"Found {len(error_events)} document-specific error events in {log_group['name']} using fallback search"
-                )
-                all_results.append(
-                    {
-                        "log_group": log_group["name"],
-                        "search_method": "document_specific_fallback",
-                        "events_found": len(error_events),
-                        "events": error_events,
-                    }
-                )
-                total_events += len(error_events)
-                break
+        if error_events:
+            search_method_used = "document_specific_fallback"
+            logger.info(
+                f"Found {len(error_events)} document-specific error events in {log_group['name']} using fallback search"
+            )
+            all_results.append(
+                {
+                    "log_group": log_group["name"],
+                    "search_method": "document_specific_fallback",
+                    "events_found": len(error_events),
+                    "events": error_events,
+                }
+            )
+            total_events += len(error_events)
+            break
 
     return {
         "all_results": all_results,
@@ -512,8 +917,13 @@ def _build_response(
         "results": search_results["all_results"],
     }
 
-    # Log complete response for troubleshooting
-    logger.info(f"CloudWatch document logs complete response: {response}")
+    # The full response can hold hundreds of KB of log events, so it is only
+    # rendered when debug logging is enabled
+    logger.info(
+        f"CloudWatch document logs search for {document_id} found "
+        f"{response['total_events_found']} events in {log_groups_searched} log groups"
+    )
+    logger.debug("CloudWatch document logs complete response: %s", response)
     return response
 
 
@@ -522,6 +932,276 @@ def _build_response(
 # =============================================================================
 
 
+def _search_log_groups_concurrently(
+    log_group_names: List[str],
+    stop_after_events: Optional[int] = None,
+    **search_kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """
+    Run _search_cloudwatch_logs against several log groups in parallel.
+
+    Results are returned in the same order as log_group_names. When
+    stop_after_events is set, searches that have not started yet are
+    cancelled once that many events have been found, and their log groups
+    are reported with no events.
+    """
+    if len(log_group_names) <= 1:
+        return [
+            _search_cloudwatch_logs(log_group_name=name, **search_kwargs)
+            for name in log_group_names
+        ]
+
+    # Worker threads do not inherit context variables, so each search runs in
+    # a copy of the caller's context to share the invocation's search memo
+    max_workers = min(len(log_group_names), MAX_CONCURRENT_LOG_SEARCHES)
+    if stop_after_events is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda context, name: context.run(
+                        _search_cloudwatch_logs, log_group_name=name, **search_kwargs
+                    ),
+                    [contextvars.copy_context() for _ in log_group_names],
+                    log_group_names,
+                )
+            )
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(log_group_names)
+    events_found = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                contextvars.copy_context().run,
+                _search_cloudwatch_logs,
+                log_group_name=name,
+                **search_kwargs,
+            ): index
+            for index, name in enumerate(log_group_names)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            events_found += result.get("events_found", 0)
+            if events_found >= stop_after_events:
+                cancelled = sum(1 for pending in futures if pending.cancel())
+                if cancelled:
+                    logger.info(
+                        f"Found {events_found} events, skipped {cancelled} remaining log group searches"
+                    )
+                break
+
+    return [
+        result
+        if result is not None
+        else {"log_group": name, "events_found": 0, "events": []}
+        for name, result in zip(log_group_names, results)
+    ]
+
+
+def _search_log_groups_with_insights(
+    log_group_names: List[str],
+    filter_pattern: str,
+    start_time: datetime,
+    end_time: datetime,
+    max_events: int = 10,
+    extra_filters: Sequence[str] = (),
+) -> List[Dict[str, Any]]:
+    """
+    Search several log groups with CloudWatch Logs Insights.
+
+    Each log group gets its own StartQuery call and row limit, so a noisy log
+    group cannot crowd the others out of the results, with up to
+    MAX_CONCURRENT_LOG_SEARCHES queries running in parallel. extra_filters are
+    additional Insights filter expressions that every returned message must
+    also satisfy. Returns one result per log group in the same order and shape
+    as _search_cloudwatch_logs. Raises ValueError if filter_pattern is not a
+    plain term or quoted literal.
+    """
+    query_string = _build_insights_query(
+        filter_pattern, limit=max_events * 5, extra_filters=extra_filters
+    )
+
+    def search_log_group(log_group_name: str) -> Dict[str, Any]:
+        rows = _run_insights_query([log_group_name], query_string, start_time, end_time)
+        events = []
+        for row in rows:
+            if len(events) >= max_events:
+                break
+
+            message = row.get("@message", "")
+            if _should_exclude_log_event(message, filter_pattern):
+                continue
+
+            events.append(
+                {
+                    "timestamp": _insights_timestamp_to_iso(row.get("@timestamp", "")),
+                    "message": message,
+                    "log_stream": row.get("@logStream", ""),
+                }
+            )
+
+        return {
+            "log_group": log_group_name,
+            "events_found": len(events),
+            "events": events,
+            "filter_pattern": filter_pattern,
+        }
+
+    if len(log_group_names) <= 1:
+        return [search_log_group(name) for name in log_group_names]
+
+    max_workers = min(len(log_group_names), MAX_CONCURRENT_LOG_SEARCHES)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(search_log_group, log_group_names))
+
+
+def _get_insights_error_counts(
+    log_group_names: List[str],
+    filter_pattern: str,
+    start_time: datetime,
+    end_time: datetime,
+) -> Optional[Dict[str, Any]]:
+    """
+    Count messages matching filter_pattern per log group and per time bucket.
+
+    Returns {"by_log_group": {name: count}, "timeline": [{"time", "count"}]},
+    or None if the counts could not be computed.
+    """
+    if _insights_literal(filter_pattern) is None:
+        return None
+
+    window_minutes = max((end_time - start_time).total_seconds() / 60, 1)
+    bin_minutes = max(5, -(-int(window_minutes) // INSIGHTS_MAX_TIMELINE_BINS))
+    query_string = "fields @log"
+    if filter_pattern:
+        query_string += f" | filter {_insights_message_filter(filter_pattern)}"
+    query_string += f" | stats count() as matches by bin({bin_minutes}m), @log"
+
+    by_log_group = {name: 0 for name in log_group_names}
+    by_time: Dict[str, int] = {}
+    try:
+        for i in range(0, len(log_group_names), INSIGHTS_MAX_LOG_GROUPS_PER_QUERY):
+            batch = log_group_names[i : i + INSIGHTS_MAX_LOG_GROUPS_PER_QUERY]
+            for row in _run_insights_query(batch, query_string, start_time, end_time):
+                log_group_name = row.get("@log", "").split(":", 1)[-1]
+                bucket = _insights_timestamp_to_iso(row.get(f"bin({bin_minutes}m)", ""))
+                matches = int(row.get("matches", 0))
+                if log_group_name in by_log_group:
+                    by_log_group[log_group_name] += matches
+                by_time[bucket] = by_time.get(bucket, 0) + matches
+    except Exception as e:
+        logger.warning(f"Logs Insights error count query failed: {e}")
+        return None
+
+    return {
+        "by_log_group": by_log_group,
+        "timeline": [
+            {"time": bucket, "count": by_time[bucket]} for bucket in sorted(by_time)
+        ],
+    }
+
+
+def _build_insights_query(
+    filter_pattern: str, limit: int, extra_filters: Sequence[str] = ()
+) -> str:
+    """
+    Build a Logs Insights query matching messages that contain filter_pattern.
+    """
+    query = "fields @timestamp, @message, @logStream"
+    if filter_pattern:
+        query += f" | filter {_insights_message_filter(filter_pattern)}"
+    for extra_filter in extra_filters:
+        query += f" | filter {extra_filter}"
+    return f"{query} | sort @timestamp asc | limit {min(limit, INSIGHTS_MAX_RESULTS)}"
+
+
+def _insights_literal(filter_pattern: str) -> Optional[str]:
+    """
+    Get the text a FilterLogEvents pattern matches as a plain substring.
+
+    Returns None for patterns using syntax Logs Insights cannot mirror with a
+    substring match: several terms, ?term alternatives, -term exclusions, JSON
+    {...} or space-delimited [...] patterns.
+    """
+    pattern = filter_pattern.strip()
+    if len(pattern) >= 2 and pattern[0] == pattern[-1] == '"':
+        literal = pattern[1:-1]
+        return literal if '"' not in literal else None
+    if _FILTER_PATTERN_SYNTAX.search(pattern) or pattern.startswith("-"):
+        return None
+    return pattern
+
+
+def _insights_message_filter(filter_pattern: str) -> str:
+    """
+    Build an Insights expression matching messages containing filter_pattern.
+
+    Raises ValueError when filter_pattern is not a plain term or quoted literal.
+    """
+    literal = _insights_literal(filter_pattern)
+    if literal is None:
+        raise ValueError(
+            f"Filter pattern {filter_pattern!r} has no Logs Insights equivalent"
+        )
+    escaped_pattern = literal.replace("\\", "\\\\").replace('"', '\\"')
+    return f'@message like "{escaped_pattern}"'
+
+
+def _run_insights_query(
+    log_group_names: List[str],
+    query_string: str,
+    start_time: datetime,
+    end_time: datetime,
+) -> List[Dict[str, str]]:
+    """
+    Run a Logs Insights query and wait for it to finish.
+
+    Returns result rows as {field: value} dicts. Raises if the query fails or
+    does not complete within INSIGHTS_QUERY_TIMEOUT_SECONDS.
+    """
+    client = _get_logs_client()
+    query_id = client.start_query(
+        logGroupNames=log_group_names,
+        startTime=int(start_time.timestamp()),
+        endTime=int(end_time.timestamp()),
+        queryString=query_string,
+    )["queryId"]
+
+    # Poll quickly at first for short queries, then back off exponentially
+    poll_interval = INSIGHTS_POLL_INTERVAL_SECONDS
+    deadline = time.monotonic() + INSIGHTS_QUERY_TIMEOUT_SECONDS
+    while True:
+        response = client.get_query_results(queryId=query_id)
+        status = response.get("status")
+        if status == "Complete":
+            return [
+                {field["field"]: field["value"] for field in row}
+                for row in response.get("results", [])
+            ]
+        if status in ("Failed", "Cancelled", "Timeout", "Unknown"):
+            raise RuntimeError(f"Logs Insights query {query_id} ended with {status}")
+        if time.monotonic() > deadline:
+            try:
+                client.stop_query(queryId=query_id)
+            except Exception as e:
+                logger.debug(f"Failed to stop Logs Insights query {query_id}: {e}")
+            raise TimeoutError(f"Logs Insights query {query_id} timed out")
+        time.sleep(  # semgrep-ignore: arbitrary-sleep - Intentional delay. Duration is hardcoded and not user-controlled.
+            poll_interval
+        )
+        poll_interval = min(poll_interval * 2, INSIGHTS_MAX_POLL_INTERVAL_SECONDS)
+
+
+def _insights_timestamp_to_iso(timestamp: str) -> str:
+    """
+    Convert a Logs Insights "YYYY-MM-DD HH:MM:SS.mmm" timestamp to ISO format.
+    """
+    try:
+        return datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S.%f").isoformat()
+    except ValueError:
+        return timestamp
+
+
 def _search_cloudwatch_logs(
     log_group_name: str,
     filter_pattern: str = "",
@@ -530,12 +1210,54 @@ def _search_cloudwatch_logs(
     start_time: Optional[datetime] = None,
     end_time: Optional[datetime] = None,
     request_id: str = "",
+    log_stream_name_prefix: str = "",
 ) -> Dict[str, Any]:
     """
     Search CloudWatch logs within a specific log group for matching patterns.
+
+    When log_stream_name_prefix is given, CloudWatch only scans log streams
+    whose names start with it. Within a tool invocation, identical searches
+    are answered from memory instead of calling CloudWatch again.
+    """
+    search_args = (
+        log_group_name,
+        filter_pattern,
+        hours_back,
+        max_events,
+        start_time,
+        end_time,
+        request_id,
+        log_stream_name_prefix,
+    )
+    memo = _search_memo.get()
+    if memo is None:
+        return _run_cloudwatch_search(*search_args)
+
+    if search_args in memo:
+        logger.debug(f"Reusing CloudWatch search results for {log_group_name}")
+        return copy.deepcopy(memo[search_args])
+
+    result = _run_cloudwatch_search(*search_args)
+    if "error" not in result:
+        memo[search_args] = copy.deepcopy(result)
+    return result
+
+
+def _run_cloudwatch_search(
+    log_group_name: str,
+    filter_pattern: str,
+    hours_back: int,
+    max_events: int,
+    start_time: Optional[datetime],
+    end_time: Optional[datetime],
+    request_id: str,
+    log_stream_name_prefix: str,
+) -> Dict[str, Any]:
+    """
+    Run a FilterLogEvents search against a single log group.
     """
     try:
-        client = boto3.client("logs")
+        client = _get_logs_client()
 
         # Use provided time window or default to hours_back from now
         if start_time is not None and end_time is not None:
@@ -548,8 +1270,7 @@ def _search_cloudwatch_logs(
         # Use higher limit for error patterns to account for INFO log filtering
         search_limit = (
             int(max_events) * 5
-            if filter_pattern
-            in ["[ERROR]", "[WARN]", "ERROR:", "WARN:", "Exception", "Failed"]
+            if filter_pattern in _ERROR_FILTER_PATTERNS
             else int(max_events)
         )
 
@@ -557,9 +1278,11 @@ def _search_cloudwatch_logs(
             "logGroupName": log_group_name,
             "startTime": int(search_start.timestamp() * 1000),
             "endTime": int(search_end.timestamp() * 1000),
-            "limit": search_limit,
         }
 
+        if log_stream_name_prefix:
+            params["logStreamNamePrefix"] = log_stream_name_prefix
+
         # Build filter pattern with request ID priority
         final_filter_pattern = _build_filter_pattern(filter_pattern, request_id)
         if final_filter_pattern:
@@ -569,11 +1292,12 @@ def _search_cloudwatch_logs(
             f"CloudWatch search params for {log_group_name}: filter='{final_filter_pattern}', request_id={request_id}"
         )
 
+        # Events are streamed page by page; stopping the slice stops paging
+        event_stream = _iter_filtered_log_events(
+            client, params, search_limit, filter_pattern, request_id
+        )
         try:
-            response = client.filter_log_events(**params)
-            logger.info(
-                f"CloudWatch API returned {len(response.get('events', []))} raw events for {log_group_name}"
-            )
+            events = list(itertools.islice(event_stream, max_events))
         except client.exceptions.ResourceNotFoundException:
             logger.warning(f"Log group {log_group_name} not found")
             return {
@@ -586,27 +1310,9 @@ def _search_cloudwatch_logs(
             logger.error(f"CloudWatch API error for {log_group_name}: {e}")
             return create_error_response(str(e), events_found=0, events=[])
 
-        events = []
-        for event in response.get("events", []):
-            message = event["message"]
-            if _should_exclude_log_event(message, filter_pattern):
-                continue
-
-            # When using request ID search, only include events with matching request ID
-            if request_id and request_id not in message:
-                continue
-
-            events.append(
-                {
-                    "timestamp": datetime.fromtimestamp(
-                        event["timestamp"] / 1000
-                    ).isoformat(),
-                    "message": message,
-                    "log_stream": event.get("logStreamName", ""),
-                }
-            )
-            if len(events) >= max_events:
-                break
+        logger.info(
+            f"CloudWatch search returned {len(events)} events for {log_group_name}"
+        )
 
         return {
             "log_group": log_group_name,
@@ -619,19 +1325,95 @@ def _search_cloudwatch_logs(
         return create_error_response(str(e), events_found=0, events=[])
 
 
+def _iter_filtered_log_events(
+    client: Any,
+    params: Dict[str, Any],
+    page_size: int,
+    filter_pattern: str,
+    request_id: str = "",
+) -> Iterator[Dict[str, str]]:
+    """
+    Lazily yield formatted FilterLogEvents events that pass noise filtering.
+
+    FilterLogEvents can return partial or empty pages while it scans, so pages
+    are fetched on demand until the caller stops iterating,
+    MAX_FILTER_LOG_EVENTS_PAGES pages have been read, or
+    MAX_EMPTY_FILTER_LOG_EVENTS_PAGES pages in a row yielded nothing.
+    """
+    paginator = client.get_paginator("filter_log_events")
+    pages = paginator.paginate(**params, PaginationConfig={"PageSize": page_size})
+
+    empty_pages = 0
+    for page in itertools.islice(pages, MAX_FILTER_LOG_EVENTS_PAGES):
+        empty_pages += 1
+        for event in page.get("events", []):
+            message = event["message"]
+            if _should_exclude_log_event(message, filter_pattern):
+                continue
+
+            # When using request ID search, only include events with matching request ID
+            if request_id and request_id not in message:
+                continue
+
+            empty_pages = 0
+            yield {
+                "timestamp": datetime.fromtimestamp(
+                    event["timestamp"] / 1000
+                ).isoformat(),
+                "message": message,
+                "log_stream": event.get("logStreamName", ""),
+            }
+
+        if empty_pages >= MAX_EMPTY_FILTER_LOG_EVENTS_PAGES:
+            break
+
+
+def _get_lambda_log_stream_prefix(
+    start_time: Optional[datetime], end_time: Optional[datetime]
+) -> str:
+    """
+    Get the Lambda log stream name prefix for a processing time window.
+
+    Lambda names its log streams "YYYY/MM/DD/[version]<id>" using the UTC date
+    the execution environment started, so a window that falls on a single UTC
+    day maps to a "YYYY/MM/DD/" prefix. Warm environments started on an earlier
+    day still write to older streams, so callers must retry without the prefix
+    when the narrowed search finds nothing. Returns an empty string when the
+    window is unknown or spans more than one day.
+    """
+    if start_time is None or end_time is None:
+        return ""
+
+    start_date = start_time.astimezone(timezone.utc).date()
+    end_date = end_time.astimezone(timezone.utc).date()
+    if start_date != end_date:
+        return ""
+
+    return start_date.strftime("%Y/%m/%d/")
+
+
 def _build_filter_pattern(base_pattern: str, request_id: str = "") -> str:
     """
     Build CloudWatch filter pattern. Use ERROR pattern and filter by request ID in post-processing.
+
+    Plain-text patterns also exclude known noise terms so CloudWatch drops those
+    events before they are returned.
     """
     if request_id:
         # Use ERROR pattern, will filter by request ID in post-processing
-        return base_pattern if base_pattern else "ERROR"
+        pattern = base_pattern if base_pattern else "ERROR"
     elif base_pattern:
-        return base_pattern
+        pattern = base_pattern
     else:
         return ""
 
+    # JSON ({...}) and space-delimited ([...]) patterns cannot take exclusions
+    if pattern.startswith(("{", "[")) or "?" in pattern:
+        return pattern
+    return " ".join([pattern, *_FILTER_PATTERN_EXCLUSIONS])
 
+
+@_ttl_cache(LOG_GROUP_CACHE_TTL_SECONDS)
 def _get_cloudwatch_log_groups(prefix: str = "") -> Dict[str, Any]:
     """
     Lists CloudWatch log groups matching specified prefix.
@@ -640,7 +1422,7 @@ def _get_cloudwatch_log_groups(prefix: str = "") -> Dict[str, Any]:
         if not prefix or len(prefix) < 5:
             return {"log_groups_found": 0, "log_groups": []}
 
-        client = boto3.client("logs")
+        client = _get_logs_client()
         response = client.describe_log_groups(logGroupNamePrefix=prefix)
 
         groups = []
@@ -666,16 +1448,16 @@ def _extract_prefix_from_state_machine_arn(arn: str) -> str:
     """
     Extracts log group prefix from Step Functions State Machine ARN.
     """
-    if ":stateMachine:" in arn:
-        state_machine_name = arn.split(":stateMachine:")[-1]
-        if "-DocumentProcessingWorkflow" in state_machine_name:
-            return state_machine_name.replace("-DocumentProcessingWorkflow", "")
-        parts = state_machine_name.split("-")
-        if len(parts) > 1:
-            return "-".join(parts[:-1])
-    return ""
+    _, separator, state_machine_name = arn.rpartition(":stateMachine:")
+    if not separator:
+        return ""
+    if "-DocumentProcessingWorkflow" in state_machine_name:
+        return state_machine_name.replace("-DocumentProcessingWorkflow", "")
+    prefix, separator, _ = state_machine_name.rpartition("-")
+    return prefix if separator else ""
 
 
+@_ttl_cache(LOG_GROUP_CACHE_TTL_SECONDS)
 def _get_log_groups_from_stack_prefix(stack_name: str) -> Dict[str, Any]:
     """
     Get all CloudWatch log groups that start with the stack prefix.
@@ -686,7 +1468,7 @@ def _get_log_groups_from_stack_prefix(stack_name: str) -> Dict[str, Any]:
     log_group_prefix = f"/{stack_name}/lambda"
 
     try:
-        client = boto3.client("logs")
+        client = _get_logs_client()
         response = client.describe_log_groups(logGroupNamePrefix=log_group_prefix)
 
         log_groups = []
@@ -709,12 +1491,13 @@ def _get_log_groups_from_stack_prefix(stack_name: str) -> Dict[str, Any]:
         return {"log_groups_found": 0, "log_groups": []}
 
 
+@_ttl_cache(LOG_GROUP_CACHE_TTL_SECONDS)
 def _get_log_group_prefix(stack_name: str) -> Dict[str, Any]:
     """
     Determines CloudWatch log group prefix from CloudFormation stack.
     """
     try:
-        cf_client = boto3.client("cloudformation")
+        cf_client = _get_cloudformation_client()
         stack_response = cf_client.describe_stacks(StackName=stack_name)
         stacks = stack_response.get("Stacks", [])
 
@@ -765,47 +1548,44 @@ def _extract_function_type(lambda_function_name: str) -> str:
     return ""
 
 
+def _get_function_log_group_name(stack_name: str, lambda_function_name: str) -> str:
+    """
+    Build the log group name of a pattern stack Lambda function.
+
+    Pattern stacks log each function to "/<stack-name>/lambda/<FunctionType>".
+    The function type is taken from the function name, but the stack name must
+    come from the resolved stack: CloudFormation shortens the stack part of
+    generated function names, e.g. DEV-P2-EA8-PATTERN2STACK-1H-OCRFunction-...
+    Returns an empty string when no function type can be extracted.
+    """
+    if not stack_name:
+        return ""
+
+    function_type = _extract_function_type(lambda_function_name)
+    if not function_type:
+        return ""
+
+    return f"/{stack_name}/lambda/{function_type}"
+
+
 def _is_error_event(message: str) -> bool:
     """
     Check if a log message is an error event.
     """
-    return any(
-        indicator in message.upper()
-        for indicator in [
-            "[ERROR]",
-            "ERROR:",
-            "EXCEPTION",
-            "FAILED",
-            "TIMEOUT",
-            "FATAL",
-            "CRITICAL",
-        ]
-    )
+    return _ERROR_INDICATOR_PATTERN.search(message) is not None
 
 
 def _should_exclude_log_event(message: str, filter_pattern: str = "") -> bool:
     """
     Filter out noise from log events while preserving relevant error information.
     """
-    message_stripped = message.strip()
+    # Oversized messages are dropped before paying for any substring scans
+    if len(message) > 1000:
+        return True
 
     # Skip INFO/debug logs when searching for errors
-    if filter_pattern and message_stripped.startswith(
-        (
-            "[INFO]",
-            "INIT_START",
-            "START",
-            "END",
-            "REPORT",
-            "Config:",
-            "Debug:",
-            "Trace:",
-        )
-    ):
+    if filter_pattern and message.lstrip().startswith(_SYSTEM_LOG_PREFIXES):
         return True
 
-    # Exclude noise patterns or oversized messages
-    return len(message) > 1000 or any(
-        pattern in message
-        for pattern in ['"sample_json"', "Processing event:", "Initialized", "Starting"]
-    )
+    # Exclude noise patterns
+    return any(pattern in message for pattern in _EXCLUDE_CONTENT)
@@ -7,6 +7,7 @@ DynamoDB tools for error analysis.
 
 import logging
 import os
+import threading
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
@@ -17,6 +18,21 @@ from ..config import create_error_response, create_response, decimal_to_float
 
 logger = logging.getLogger(__name__)
 
+# boto3 resources are not thread-safe, so each thread keeps its own DynamoDB
+# resource, created on first use and reused across tool calls
+_thread_local = threading.local()
+
+
+def _get_dynamodb_resource():
+    """
+    Get or initialize the DynamoDB resource for the current thread.
+    """
+    resource = getattr(_thread_local, "dynamodb", None)
+    if resource is None:
+        resource = boto3.resource("dynamodb")
+        _thread_local.dynamodb = resource
+    return resource
+
 
 @tool
 def fetch_document_record(object_key: str) -> Dict[str, Any]:
@@ -60,7 +76,7 @@ def fetch_document_record(object_key: str) -> Dict[str, Any]:
         - suggestion (str): Alternative tools to use if tracking unavailable
     """
     try:
-        tracking_table, table_name = _get_tracking_table()
+        tracking_table, table_name = get_tracking_table()
         if not tracking_table:
             return create_response(
                 {
@@ -149,7 +165,7 @@ def fetch_recent_records(
         - hours_back (int): Hours looked back
     """
     try:
-        tracking_table, table_name = _get_tracking_table()
+        tracking_table, table_name = get_tracking_table()
         if not tracking_table:
             return _create_empty_response(date, hours_back)
 
@@ -182,9 +198,9 @@ def fetch_recent_records(
         )
 
 
-def _get_tracking_table():
+def get_tracking_table():
     """
-    Internal utility to get tracking table resource with validation.
+    Get the tracking table resource with validation.
 
     Returns:
         Tuple of (table_resource, table_name) or (None, None) if not configured
@@ -193,8 +209,7 @@ def _get_tracking_table():
     if not table_name:
         return None, None
 
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table(table_name)  # type: ignore[attr-defined]
+    table = _get_dynamodb_resource().Table(table_name)  # type: ignore[attr-defined]
     return table, table_name
 
 
@@ -5,6 +5,7 @@
 Lambda tools for document context extraction.
 """
 
+import functools
 import json
 import logging
 import os
@@ -19,6 +20,14 @@ from ..config import create_error_response
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _get_lambda_client():
+    """
+    Get the shared Lambda client, created on first use.
+    """
+    return boto3.client("lambda")
+
+
 @tool
 def retrieve_document_context(document_id: str) -> Dict[str, Any]:
     """
@@ -51,7 +60,7 @@ def retrieve_document_context(document_id: str) -> Dict[str, Any]:
         Dict containing document context, execution details, and timing information
     """
     try:
-        lambda_client = boto3.client("lambda")
+        lambda_client = _get_lambda_client()
         function_name = get_lookup_function_name()
 
         logger.info(
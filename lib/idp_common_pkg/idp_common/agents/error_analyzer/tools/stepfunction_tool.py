@@ -5,6 +5,7 @@
 Step Function tools for document-specific workflow execution analysis.
 """
 
+import functools
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -16,6 +17,14 @@ from idp_common.config import get_config
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _get_stepfunctions_client():
+    """
+    Get the shared Step Functions client, created on first use.
+    """
+    return boto3.client("stepfunctions")
+
+
 @tool
 def analyze_workflow_execution(document_id: str = "") -> Dict[str, Any]:
     """
@@ -117,7 +126,7 @@ def _get_execution_data(execution_arn: str) -> Dict[str, Any]:
     """
     Retrieve execution details and history from Step Functions.
     """
-    stepfunctions_client = boto3.client("stepfunctions")
+    stepfunctions_client = _get_stepfunctions_client()
 
     execution_response = stepfunctions_client.describe_execution(
         executionArn=execution_arn
@@ -5,13 +5,14 @@
 X-Ray tools for tracing analysis and performance monitoring.
 """
 
+import functools
 import json
 import logging
-import os
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 import boto3
+from botocore.config import Config
 from strands import tool
 
 from idp_common.config import get_config
@@ -19,9 +20,21 @@ from idp_common.config import get_config
 from ..config import (
     create_error_response,
 )
+from .dynamodb_tool import get_tracking_table
 
 logger = logging.getLogger(__name__)
 
+# Adaptive retries back off client-side when X-Ray throttles trace lookups
+_BOTO_CONFIG = Config(retries={"max_attempts": 10, "mode": "adaptive"})
+
+
+@functools.cache
+def _get_xray_client():
+    """
+    Get the shared X-Ray client, created on first use.
+    """
+    return boto3.client("xray", config=_BOTO_CONFIG)
+
 
 @tool
 def analyze_document_trace(document_id: str) -> Dict[str, Any]:
@@ -59,7 +72,7 @@ def analyze_document_trace(document_id: str) -> Dict[str, Any]:
         if not document_id:
             return create_error_response("No document ID provided")
 
-        xray_client = boto3.client("xray")
+        xray_client = _get_xray_client()
 
         # Find trace ID for the document
         xray_trace_id = _find_trace_id_for_document(document_id, xray_client)
@@ -127,7 +140,7 @@ def analyze_system_performance(
     """
     try:
         # hours_back already has proper default
-        xray_client = boto3.client("xray")
+        xray_client = _get_xray_client()
 
         end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(hours=hours_back)
@@ -217,13 +230,10 @@ def _get_trace_id_from_dynamodb(document_id: str) -> Optional[str]:
     """
     Get trace ID from DynamoDB tracking table.
     """
-    tracking_table_name = os.environ.get("TRACKING_TABLE_NAME")
-    if not tracking_table_name:
-        return None
-
     try:
-        dynamodb = boto3.resource("dynamodb")
-        tracking_table = dynamodb.Table(tracking_table_name)  # type: ignore[attr-defined]
+        tracking_table, _ = get_tracking_table()
+        if tracking_table is None:
+            return None
 
         response = tracking_table.get_item(
             Key={"PK": f"doc#{document_id}", "SK": "none"}
@@ -373,7 +383,7 @@ def extract_lambda_request_ids(xray_trace_id: str) -> Dict[str, str]:
         Dict mapping Lambda function names to their CloudWatch request IDs
     """
     logger.info(f"Extracting Lambda request IDs from X-Ray trace: {xray_trace_id}")
-    xray_client = boto3.client("xray")
+    xray_client = _get_xray_client()
 
     try:
         response = xray_client.batch_get_traces(TraceIds=[xray_trace_id])
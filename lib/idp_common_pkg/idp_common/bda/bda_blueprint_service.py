@@ -128,16 +128,12 @@ class BdaBlueprintService:
                     def_value
                 )
 
-        # Transform properties and update $ref paths
+        # Transform properties ($ref paths are rewritten by _add_bda_fields_to_schema)
         blueprint["properties"] = {}
         for prop_name, prop_value in json_schema.get(SCHEMA_PROPERTIES, {}).items():
-            transformed = self._add_bda_fields_to_schema(prop_value)
-            # Update $ref paths from #/$defs/ to #/definitions/
-            if REF_FIELD in transformed:
-                transformed[REF_FIELD] = transformed[REF_FIELD].replace(
-                    "/$defs/", "/definitions/"
-                )
-            blueprint["properties"][prop_name] = transformed
+            blueprint["properties"][prop_name] = self._add_bda_fields_to_schema(
+                prop_value
+            )
 
         return blueprint
 
@@ -157,20 +153,32 @@ class BdaBlueprintService:
             Schema with BDA fields, description removed
         """
         if not isinstance(schema, dict):
-            return schema
+            # Copied because callers hand in values taken straight from the input
+            return deepcopy(schema)
 
         # If this has a $ref, return ONLY the $ref (strip all other fields)
         if REF_FIELD in schema:
             # Pure $ref should have nothing else - this is critical for BDA
             return {REF_FIELD: schema[REF_FIELD].replace("/$defs/", "/definitions/")}
 
-        # Make deep copy to avoid mutation
-        result = deepcopy(schema)
-
-        # Remove description field - BDA doesn't use it (only instruction)
-        result.pop(SCHEMA_DESCRIPTION, None)
-
-        prop_type = result.get(SCHEMA_TYPE, "string")
+        prop_type = schema.get(SCHEMA_TYPE, "string")
+
+        # Copy the node to avoid mutation. Nested properties/items are rebuilt by
+        # the recursion below, so only the remaining values are deep copied here
+        # rather than copying each subtree again at every level.
+        recurse_into = (
+            SCHEMA_PROPERTIES
+            if prop_type == TYPE_OBJECT
+            else SCHEMA_ITEMS
+            if prop_type == TYPE_ARRAY
+            else None
+        )
+        result = {
+            key: value if key == recurse_into else deepcopy(value)
+            for key, value in schema.items()
+            # Remove description field - BDA doesn't use it (only instruction)
+            if key != SCHEMA_DESCRIPTION
+        }
 
         # Add BDA fields ONLY for leaf/primitive types
         if prop_type not in [TYPE_OBJECT, TYPE_ARRAY]:
@@ -234,10 +242,18 @@ class BdaBlueprintService:
 
         return result
 
-    def _check_for_updates(self, custom_class: dict, blueprint: dict):
+    def _check_for_updates(
+        self,
+        custom_class: dict,
+        blueprint: dict,
+        transformed_custom: Optional[dict] = None,
+    ):
         """
         Check if the custom_class JSON Schema differs from the existing blueprint.
         Transform both to Bedrock format and then compare.
+
+        transformed_custom can be passed when the caller has already transformed
+        custom_class, so the schema is not transformed twice.
         """
         # Parse the blueprint schema
         blueprint_schema = blueprint["schema"]
@@ -245,9 +261,10 @@ class BdaBlueprintService:
             blueprint_schema = json.loads(blueprint_schema)
 
         # Transform the custom_class to Bedrock format for comparison
-        transformed_custom = self._transform_json_schema_to_bedrock_blueprint(
-            custom_class
-        )
+        if transformed_custom is None:
+            transformed_custom = self._transform_json_schema_to_bedrock_blueprint(
+                custom_class
+            )
 
         # Use DeepDiff to compare the schemas
         diff = DeepDiff(blueprint_schema, transformed_custom, ignore_order=True)
@@ -329,15 +346,18 @@ class BdaBlueprintService:
                         )
                         blueprints_updated.append(blueprint_arn)
 
-                        # Check for updates on existing blueprint
+                        # Check for updates on existing blueprint, reusing the
+                        # transformed schema for the update itself
+                        blueprint_schema = (
+                            self._transform_json_schema_to_bedrock_blueprint(
+                                custom_class
+                            )
+                        )
                         if self._check_for_updates(
-                            custom_class=custom_class, blueprint=blueprint_exists
+                            custom_class=custom_class,
+                            blueprint=blueprint_exists,
+                            transformed_custom=blueprint_schema,
                         ):
-                            blueprint_schema = (
-                                self._transform_json_schema_to_bedrock_blueprint(
-                                    custom_class
-                                )
-                            )
                             logger.info(
                                 f"Blueprint schema generate:: for {json.dumps(custom_class, indent=2)}"
                             )
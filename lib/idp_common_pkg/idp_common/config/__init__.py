@@ -142,8 +142,10 @@ class ConfigurationReader:
                 default_config.pop("Configuration", None)
                 custom_config.pop("Configuration", None)
 
-                # Merge configurations - simple update since Custom only contains overrides
-                merged_config = self.simple_merge(default_config, custom_config)
+                # Merge configurations - simple update since Custom only contains overrides.
+                # default_config is a fresh model_dump, so it is updated in place rather
+                # than deep-copied again by simple_merge
+                merged_config = deep_update(default_config, custom_config)
 
             logger.info("Successfully merged configurations")
 
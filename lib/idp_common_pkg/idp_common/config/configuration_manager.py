@@ -121,8 +121,6 @@ class ConfigurationManager:
         Returns:
             New custom configuration with user changes preserved
         """
-        from copy import deepcopy
-
         # Convert to dicts
         old_default_dict = old_default.model_dump(mode="python")
         old_custom_dict = old_custom.model_dump(mode="python")
@@ -136,8 +134,8 @@ class ConfigurationManager:
         )
 
         # Start with new default and apply user customizations
-        new_custom_dict = deepcopy(new_default_dict)
-        deep_update(new_custom_dict, user_customizations)
+        # (model_dump already returned a fresh dict, so it can be updated in place)
+        new_custom_dict = deep_update(new_default_dict, user_customizations)
 
         return IDPConfig(**new_custom_dict)
 
@@ -8,6 +8,18 @@ Utility functions for configuration merging and manipulation.
 from typing import Dict, Any
 from copy import deepcopy
 
+# Leaf types that cannot be mutated, so they can be shared instead of copied.
+# Tuples and frozensets are excluded because they may hold mutable items.
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None), bytes)
+_MISSING = object()
+
+
+def _copy_value(value: Any) -> Any:
+    """
+    Deep copy a value, returning immutable leaves as-is.
+    """
+    return value if type(value) in _IMMUTABLE_TYPES else deepcopy(value)
+
 
 def deep_update(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -23,11 +35,15 @@ def deep_update(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any
     Returns:
         Updated target dictionary (modified in place)
     """
-    for key, value in source.items():
-        if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-            deep_update(target[key], value)
-        else:
-            target[key] = deepcopy(value)
+    stack = [(target, source)]
+    while stack:
+        current_target, current_source = stack.pop()
+        for key, value in current_source.items():
+            existing = current_target.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                stack.append((existing, value))
+            else:
+                current_target[key] = _copy_value(value)
     return target
 
 
@@ -36,7 +52,7 @@ def get_diff_dict(base: Dict[str, Any], modified: Dict[str, Any]) -> Dict[str, A
     Get a dictionary containing only the fields that differ between base and modified.
 
     This creates a "diff dict" that when applied to base (via deep_update) would
-    produce modified. Recursively compares nested dictionaries.
+    produce modified. Nested dictionaries are compared level by level.
 
     Args:
         base: Base/default dictionary
@@ -50,21 +66,36 @@ def get_diff_dict(base: Dict[str, Any], modified: Dict[str, Any]) -> Dict[str, A
         modified = {"a": 1, "b": {"c": 5, "d": 3}, "e": 6}
         result = {"b": {"c": 5}, "e": 6}  # Only changed/added fields
     """
-    diff = {}
-
-    # Check for added or changed keys in modified
-    for key, value in modified.items():
-        if key not in base:
-            # New key - include it
-            diff[key] = deepcopy(value)
-        elif isinstance(value, dict) and isinstance(base[key], dict):
-            # Both are dicts - recurse
-            nested_diff = get_diff_dict(base[key], value)
-            if nested_diff:  # Only include if there are differences
-                diff[key] = nested_diff
-        elif value != base[key]:
-            # Value changed
-            diff[key] = deepcopy(value)
+    diff: Dict[str, Any] = {}
+    # Nested diffs are attached to their parent as they are created so key
+    # order is preserved; empty ones are pruned once the walk is done
+    nested = []
+    stack = [(base, modified, diff)]
+    while stack:
+        current_base, current_modified, current_diff = stack.pop()
+        for key, value in current_modified.items():
+            base_value = current_base.get(key, _MISSING)
+            if value is base_value:
+                # The same object cannot differ from itself
+                continue
+            if base_value is _MISSING:
+                # New key - include it
+                current_diff[key] = _copy_value(value)
+            elif isinstance(value, dict) and isinstance(base_value, dict):
+                # Both are dicts - compare them on a later iteration
+                nested_diff: Dict[str, Any] = {}
+                current_diff[key] = nested_diff
+                nested.append((current_diff, key, nested_diff))
+                stack.append((base_value, value, nested_diff))
+            elif value != base_value:
+                # Value changed
+                current_diff[key] = _copy_value(value)
+
+    # Children are recorded after their parents, so pruning in reverse also
+    # drops parents that only contained empty diffs
+    for parent, key, nested_diff in reversed(nested):
+        if not nested_diff:  # Only include if there are differences
+            del parent[key]
 
     # Note: We don't track deletions (keys in base but not in modified)
     # This is intentional - Custom should always be a complete config
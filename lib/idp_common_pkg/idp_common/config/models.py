@@ -19,7 +19,37 @@ Usage:
 """
 
 from typing import Any, Dict, List, Optional, Union, Literal, Annotated
-from pydantic import BaseModel, ConfigDict, Field, field_validator, Discriminator
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    field_validator,
+    Discriminator,
+)
+
+
+def _parse_float(v: Any) -> Any:
+    """Parse float from string; numbers are left to pydantic's own coercion"""
+    if isinstance(v, str):
+        return float(v) if v else 0.0
+    if isinstance(v, (int, float)):
+        return v
+    return float(v)
+
+
+def _parse_int(v: Any) -> Any:
+    """Parse int from string; ints are left to pydantic's own coercion"""
+    if isinstance(v, str):
+        return int(v) if v else 0
+    if isinstance(v, int):
+        return v
+    return int(v)
+
+
+# Numeric fields that also accept string values (e.g. from the UI or DynamoDB)
+CoercedFloat = Annotated[float, BeforeValidator(_parse_float)]
+CoercedInt = Annotated[int, BeforeValidator(_parse_int)]
 
 
 class ImageConfig(BaseModel):
@@ -94,32 +124,16 @@ class ExtractionConfig(BaseModel):
     task_prompt: str = Field(
         default="", description="Task prompt template for extraction"
     )
-    temperature: float = Field(default=0.0, ge=0.0, le=1.0)
-    top_p: float = Field(default=0.1, ge=0.0, le=1.0)
-    top_k: float = Field(default=5.0, ge=0.0)
-    max_tokens: int = Field(default=10000, gt=0)
+    temperature: CoercedFloat = Field(default=0.0, ge=0.0, le=1.0)
+    top_p: CoercedFloat = Field(default=0.1, ge=0.0, le=1.0)
+    top_k: CoercedFloat = Field(default=5.0, ge=0.0)
+    max_tokens: CoercedInt = Field(default=10000, gt=0)
     image: ImageConfig = Field(default_factory=ImageConfig)
     agentic: AgenticConfig = Field(default_factory=AgenticConfig)
     custom_prompt_lambda_arn: Optional[str] = Field(
         default=None, description="ARN of custom prompt Lambda"
     )
 
-    @field_validator("temperature", "top_p", "top_k", mode="before")
-    @classmethod
-    def parse_float(cls, v: Any) -> float:
-        """Parse float from string or number"""
-        if isinstance(v, str):
-            return float(v) if v else 0.0
-        return float(v)
-
-    @field_validator("max_tokens", mode="before")
-    @classmethod
-    def parse_int(cls, v: Any) -> int:
-        """Parse int from string or number"""
-        if isinstance(v, str):
-            return int(v) if v else 0
-        return int(v)
-
 
 class ClassificationConfig(BaseModel):
     """Document classification configuration"""
@@ -134,10 +148,10 @@ class ClassificationConfig(BaseModel):
     task_prompt: str = Field(
         default="", description="Task prompt template for classification"
     )
-    temperature: float = Field(default=0.0, ge=0.0, le=1.0)
-    top_p: float = Field(default=0.1, ge=0.0, le=1.0)
-    top_k: float = Field(default=5.0, ge=0.0)
-    max_tokens: int = Field(default=4096, gt=0)
+    temperature: CoercedFloat = Field(default=0.0, ge=0.0, le=1.0)
+    top_p: CoercedFloat = Field(default=0.1, ge=0.0, le=1.0)
+    top_k: CoercedFloat = Field(default=5.0, ge=0.0)
+    max_tokens: CoercedInt = Field(default=4096, gt=0)
     maxPagesForClassification: int = Field(
         default=0,
         description="Max pages to use for classification. 0 or negative = ALL pages, positive = limit to N pages",
@@ -145,22 +159,6 @@ class ClassificationConfig(BaseModel):
     classificationMethod: str = Field(default="multimodalPageLevelClassification")
     image: ImageConfig = Field(default_factory=ImageConfig)
 
-    @field_validator("temperature", "top_p", "top_k", mode="before")
-    @classmethod
-    def parse_float(cls, v: Any) -> float:
-        """Parse float from string or number"""
-        if isinstance(v, str):
-            return float(v) if v else 0.0
-        return float(v)
-
-    @field_validator("max_tokens", mode="before")
-    @classmethod
-    def parse_int(cls, v: Any) -> int:
-        """Parse int from string or number"""
-        if isinstance(v, str):
-            return int(v) if v else 0
-        return int(v)
-
     @field_validator("maxPagesForClassification", mode="before")
     @classmethod
     def parse_max_pages(cls, v: Any) -> int:
@@ -176,19 +174,9 @@ class GranularAssessmentConfig(BaseModel):
     """Granular assessment configuration"""
 
     enabled: bool = Field(default=False, description="Enable granular assessment")
-    list_batch_size: int = Field(default=1, gt=0)
-    simple_batch_size: int = Field(default=3, gt=0)
-    max_workers: int = Field(default=20, gt=0)
-
-    @field_validator(
-        "list_batch_size", "simple_batch_size", "max_workers", mode="before"
-    )
-    @classmethod
-    def parse_int(cls, v: Any) -> int:
-        """Parse int from string or number"""
-        if isinstance(v, str):
-            return int(v) if v else 0
-        return int(v)
+    list_batch_size: CoercedInt = Field(default=1, gt=0)
+    simple_batch_size: CoercedInt = Field(default=3, gt=0)
+    max_workers: CoercedInt = Field(default=20, gt=0)
 
 
 class AssessmentConfig(BaseModel):
@@ -266,33 +254,15 @@ Provide your assessment as a JSON object with this exact structure:
 }""",
         description="Task prompt template for assessment",
     )
-    temperature: float = Field(default=0.0, ge=0.0, le=1.0)
-    top_p: float = Field(default=0.1, ge=0.0, le=1.0)
-    top_k: float = Field(default=5.0, ge=0.0)
-    max_tokens: int = Field(default=10000, gt=0)
-    default_confidence_threshold: float = Field(default=0.8, ge=0.0, le=1.0)
+    temperature: CoercedFloat = Field(default=0.0, ge=0.0, le=1.0)
+    top_p: CoercedFloat = Field(default=0.1, ge=0.0, le=1.0)
+    top_k: CoercedFloat = Field(default=5.0, ge=0.0)
+    max_tokens: CoercedInt = Field(default=10000, gt=0)
+    default_confidence_threshold: CoercedFloat = Field(default=0.8, ge=0.0, le=1.0)
     validation_enabled: bool = Field(default=False, description="Enable validation")
     image: ImageConfig = Field(default_factory=ImageConfig)
     granular: GranularAssessmentConfig = Field(default_factory=GranularAssessmentConfig)
 
-    @field_validator(
-        "temperature", "top_p", "top_k", "default_confidence_threshold", mode="before"
-    )
-    @classmethod
-    def parse_float(cls, v: Any) -> float:
-        """Parse float from string or number"""
-        if isinstance(v, str):
-            return float(v) if v else 0.0
-        return float(v)
-
-    @field_validator("max_tokens", mode="before")
-    @classmethod
-    def parse_int(cls, v: Any) -> int:
-        """Parse int from string or number"""
-        if isinstance(v, str):
-            return int(v) if v else 0
-        return int(v)
-
 
 class SummarizationConfig(BaseModel):
     """Document summarization configuration"""
@@ -308,26 +278,10 @@ class SummarizationConfig(BaseModel):
     task_prompt: str = Field(
         default="", description="Task prompt template for summarization"
     )
-    temperature: float = Field(default=0.0, ge=0.0, le=1.0)
-    top_p: float = Field(default=0.1, ge=0.0, le=1.0)
-    top_k: float = Field(default=5.0, ge=0.0)
-    max_tokens: int = Field(default=4096, gt=0)
-
-    @field_validator("temperature", "top_p", "top_k", mode="before")
-    @classmethod
-    def parse_float(cls, v: Any) -> float:
-        """Parse float from string or number"""
-        if isinstance(v, str):
-            return float(v) if v else 0.0
-        return float(v)
-
-    @field_validator("max_tokens", mode="before")
-    @classmethod
-    def parse_int(cls, v: Any) -> int:
-        """Parse int from string or number"""
-        if isinstance(v, str):
-            return int(v) if v else 0
-        return int(v)
+    temperature: CoercedFloat = Field(default=0.0, ge=0.0, le=1.0)
+    top_p: CoercedFloat = Field(default=0.1, ge=0.0, le=1.0)
+    top_k: CoercedFloat = Field(default=5.0, ge=0.0)
+    max_tokens: CoercedInt = Field(default=4096, gt=0)
 
 
 class OCRFeature(BaseModel):
@@ -369,10 +323,10 @@ class OCRConfig(BaseModel):
 class ErrorAnalyzerParameters(BaseModel):
     """Error analyzer parameters configuration"""
 
-    max_log_events: int = Field(
+    max_log_events: CoercedInt = Field(
         default=5, gt=0, description="Maximum number of log events to retrieve"
     )
-    time_range_hours_default: int = Field(
+    time_range_hours_default: CoercedInt = Field(
         default=24, gt=0, description="Default time range in hours for log searches"
     )
 
@@ -395,14 +349,6 @@ class ErrorAnalyzerParameters(BaseModel):
         default=10000, gt=0, description="Response time threshold in milliseconds"
     )
 
-    @field_validator("max_log_events", "time_range_hours_default", mode="before")
-    @classmethod
-    def parse_int(cls, v: Any) -> int:
-        """Parse int from string or number"""
-        if isinstance(v, str):
-            return int(v) if v else 0
-        return int(v)
-
 
 class ErrorAnalyzerConfig(BaseModel):
     """Error analyzer agent configuration"""
@@ -667,54 +613,33 @@ class CriteriaValidationConfig(BaseModel):
     )
     system_prompt: str = Field(default="", description="System prompt")
     task_prompt: str = Field(default="", description="Task prompt")
-    temperature: float = Field(default=0.0, ge=0.0, le=1.0)
-    top_p: float = Field(default=0.01, ge=0.0, le=1.0)
-    top_k: float = Field(default=20.0, ge=0.0)
-    max_tokens: int = Field(default=4096, gt=0)
-    semaphore: int = Field(
+    temperature: CoercedFloat = Field(default=0.0, ge=0.0, le=1.0)
+    top_p: CoercedFloat = Field(default=0.01, ge=0.0, le=1.0)
+    top_k: CoercedFloat = Field(default=20.0, ge=0.0)
+    max_tokens: CoercedInt = Field(default=4096, gt=0)
+    semaphore: CoercedInt = Field(
         default=3, gt=0, description="Number of concurrent API calls"
     )
-    max_chunk_size: int = Field(
+    max_chunk_size: CoercedInt = Field(
         default=180000, gt=0, description="Maximum tokens per chunk"
     )
-    token_size: int = Field(default=4, gt=0, description="Average characters per token")
-    overlap_percentage: int = Field(
+    token_size: CoercedInt = Field(
+        default=4, gt=0, description="Average characters per token"
+    )
+    overlap_percentage: CoercedInt = Field(
         default=10, ge=0, le=100, description="Chunk overlap percentage"
     )
     response_prefix: str = Field(
         default="<response>", description="Response prefix marker"
     )
 
-    @field_validator("temperature", "top_p", "top_k", mode="before")
-    @classmethod
-    def parse_float(cls, v: Any) -> float:
-        """Parse float from string or number"""
-        if isinstance(v, str):
-            return float(v) if v else 0.0
-        return float(v)
-
-    @field_validator(
-        "max_tokens",
-        "semaphore",
-        "max_chunk_size",
-        "token_size",
-        "overlap_percentage",
-        mode="before",
-    )
-    @classmethod
-    def parse_int(cls, v: Any) -> int:
-        """Parse int from string or number"""
-        if isinstance(v, str):
-            return int(v) if v else 0
-        return int(v)
-
 
 class EvaluationLLMMethodConfig(BaseModel):
     """Evaluation LLM method configuration"""
 
-    top_p: float = Field(default=0.1, ge=0.0, le=1.0)
-    max_tokens: int = Field(default=4096, gt=0)
-    top_k: float = Field(default=5.0, ge=0.0)
+    top_p: CoercedFloat = Field(default=0.1, ge=0.0, le=1.0)
+    max_tokens: CoercedInt = Field(default=4096, gt=0)
+    top_k: CoercedFloat = Field(default=5.0, ge=0.0)
     task_prompt: str = Field(
         default="""
         I need to evaluate attribute extraction for a document of class: {DOCUMENT_CLASS}.
@@ -742,7 +667,7 @@ class EvaluationLLMMethodConfig(BaseModel):
         description="Task prompt for evaluation",
     )
 
-    temperature: float = Field(default=0.0, ge=0.0, le=1.0)
+    temperature: CoercedFloat = Field(default=0.0, ge=0.0, le=1.0)
     model: str = Field(
         default="us.anthropic.claude-3-haiku-20240307-v1:0",
         description="Bedrock model ID for evaluation",
@@ -752,22 +677,6 @@ class EvaluationLLMMethodConfig(BaseModel):
         description="System prompt for evaluation",
     )
 
-    @field_validator("temperature", "top_p", "top_k", mode="before")
-    @classmethod
-    def parse_float(cls, v: Any) -> float:
-        """Parse float from string or number"""
-        if isinstance(v, str):
-            return float(v) if v else 0.0
-        return float(v)
-
-    @field_validator("max_tokens", mode="before")
-    @classmethod
-    def parse_int(cls, v: Any) -> int:
-        """Parse int from string or number"""
-        if isinstance(v, str):
-            return int(v) if v else 0
-        return int(v)
-
 
 class EvaluationConfig(BaseModel):
     """Evaluation configuration for assessment"""
@@ -786,29 +695,13 @@ class DiscoveryModelConfig(BaseModel):
         default="us.amazon.nova-pro-v1:0", description="Bedrock model ID for discovery"
     )
     system_prompt: str = Field(default="", description="System prompt for discovery")
-    temperature: float = Field(default=1.0, ge=0.0, le=1.0)
-    top_p: float = Field(default=0.1, ge=0.0, le=1.0)
-    max_tokens: int = Field(default=10000, gt=0)
+    temperature: CoercedFloat = Field(default=1.0, ge=0.0, le=1.0)
+    top_p: CoercedFloat = Field(default=0.1, ge=0.0, le=1.0)
+    max_tokens: CoercedInt = Field(default=10000, gt=0)
     user_prompt: str = Field(
         default="", description="User prompt template for discovery"
     )
 
-    @field_validator("temperature", "top_p", mode="before")
-    @classmethod
-    def parse_float(cls, v: Any) -> float:
-        """Parse float from string or number"""
-        if isinstance(v, str):
-            return float(v) if v else 0.0
-        return float(v)
-
-    @field_validator("max_tokens", mode="before")
-    @classmethod
-    def parse_int(cls, v: Any) -> int:
-        """Parse int from string or number"""
-        if isinstance(v, str):
-            return int(v) if v else 0
-        return int(v)
-
 
 class DiscoveryConfig(BaseModel):
     """Discovery configuration"""
@@ -521,13 +521,20 @@ class Document:
             logger.error(f"Error building document from S3: {str(e)}")
             raise
 
-    def compress(self, bucket: str, step_name: str = "processing") -> Dict[str, Any]:
+    def compress(
+        self,
+        bucket: str,
+        step_name: str = "processing",
+        document_json: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Store full document in S3 and return lightweight wrapper for Step Functions.
 
         Args:
             bucket: S3 bucket to store the full document
             step_name: Name of the processing step (for unique S3 key)
+            document_json: Document already serialized with to_json(), to avoid
+                serializing it again
 
         Returns:
             Lightweight wrapper containing essential fields and section IDs for Map step
@@ -545,7 +552,9 @@ class Document:
 
         try:
             # Store full document in S3
-            full_document_json = self.to_json()
+            full_document_json = (
+                document_json if document_json is not None else self.to_json()
+            )
             s3_client.put_object(
                 Bucket=bucket,
                 Key=s3_key,
@@ -675,7 +684,8 @@ class Document:
         Returns:
             dict: Response data with either compressed reference or document dict
         """
-        document_json = json.dumps(self.to_dict(), default=str)
+        document_dict = self.to_dict()
+        document_json = json.dumps(document_dict, default=str)
         document_size = len(document_json.encode("utf-8"))
         threshold_bytes = size_threshold_kb * 1024
 
@@ -688,11 +698,13 @@ class Document:
                 logger.info(
                     f"Document size ({document_size} bytes) exceeds {size_threshold_kb}KB threshold, compressing to S3"
                 )
-            compressed_data = self.compress(working_bucket, step_name)
+            compressed_data = self.compress(
+                working_bucket, step_name, document_json=document_json
+            )
             return compressed_data
         else:
             if logger:
                 logger.info(
                     f"Document size ({document_size} bytes) is under {size_threshold_kb}KB threshold, returning as JSON"
                 )
-            return self.to_dict()
+            return document_dict
@@ -13,6 +13,9 @@ logger = logging.getLogger(__name__)
 # Initialize clients
 _s3_client = None
 
+# File extensions recognized as images when listing a prefix or directory
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp'})
+
 def get_s3_client():
     """
     Get or initialize the S3 client
@@ -150,12 +153,10 @@ def list_images_from_path(image_path: str) -> List[str]:
     Returns:
         List of image file paths/URIs sorted by filename
     """
-    image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp'}
-    
     if image_path.startswith('s3://'):
-        return _list_s3_images(image_path, image_extensions)
+        return _list_s3_images(image_path, IMAGE_EXTENSIONS)
     else:
-        return _list_local_images(image_path, image_extensions)
+        return _list_local_images(image_path, IMAGE_EXTENSIONS)
 
 def _list_s3_images(s3_prefix: str, image_extensions: set) -> List[str]:
     """
@@ -193,7 +194,7 @@ def _list_s3_images(s3_prefix: str, image_extensions: set) -> List[str]:
                         image_files.append(f"s3://{bucket}/{key}")
         
         # Sort by filename (not full path)
-        image_files.sort(key=lambda x: os.path.basename(x))
+        image_files.sort(key=os.path.basename)
         logger.info(f"Found {len(image_files)} image files in S3 prefix: {s3_prefix}")
         return image_files
         
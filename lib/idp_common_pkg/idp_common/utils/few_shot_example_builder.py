@@ -1,6 +1,12 @@
+import hashlib
 import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError
 from idp_common import image, s3
-from typing import Any, Dict, List
+from idp_common.utils import parse_s3_uri
+from typing import Any, Dict, List, Optional, Tuple
 
 from idp_common.config.models import IDPConfig
 from idp_common.config.schema_constants import (
@@ -10,6 +16,20 @@ from idp_common.config.schema_constants import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent listings/downloads when loading example images
+MAX_EXAMPLE_IMAGE_WORKERS = 16
+
+# Suffixes that mark an image path as a single file (str.endswith needs a tuple)
+_IMAGE_EXTENSIONS = tuple(s3.IMAGE_EXTENSIONS)
+
+# Example images downloaded from S3 are kept here so warm containers only
+# re-download them when their ETag changes
+FEW_SHOT_IMAGE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "fewshot_cache")
+
+# Least recently used images are evicted once the cache holds more than this,
+# since /tmp is shared with OCR and other temporary files
+FEW_SHOT_IMAGE_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
 
 def _get_image_files_from_path(image_path: str) -> List[str]:
     """
@@ -21,16 +41,13 @@ def _get_image_files_from_path(image_path: str) -> List[str]:
     Returns:
         List of image file paths/URIs sorted by filename
     """
-    import os
-
-    from idp_common import s3
+    # A path with an image suffix names a single file rather than a prefix
+    is_image_file = image_path.lower().endswith(_IMAGE_EXTENSIONS)
 
     # Handle S3 URIs
     if image_path.startswith("s3://"):
         # Check if it's a direct file or a prefix
-        if image_path.endswith(
-            (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif", ".webp")
-        ):
+        if is_image_file:
             # Direct S3 file
             return [image_path]
         else:
@@ -46,9 +63,7 @@ def _get_image_files_from_path(image_path: str) -> List[str]:
             s3_uri = f"s3://{config_bucket}/{image_path}"
 
             # Check if it's a direct file or a prefix
-            if image_path.endswith(
-                (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif", ".webp")
-            ):
+            if is_image_file:
                 # Direct S3 file
                 return [s3_uri]
             else:
@@ -75,6 +90,202 @@ def _get_image_files_from_path(image_path: str) -> List[str]:
             )
 
 
+def _evict_cached_images(keep_path: str) -> None:
+    """
+    Delete the least recently used cached images (and their ETags) until the
+    cache is within FEW_SHOT_IMAGE_CACHE_MAX_BYTES. keep_path is never deleted.
+    """
+    entries = []
+    total_bytes = 0
+    with os.scandir(FEW_SHOT_IMAGE_CACHE_DIR) as it:
+        for entry in it:
+            # ETag files are removed with their image; .tmp files are in-flight writes
+            if entry.name.endswith((".etag", ".tmp")):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            total_bytes += stat.st_size
+            entries.append((stat.st_mtime, entry.path, stat.st_size))
+
+    for _, path, size in sorted(entries):
+        if total_bytes <= FEW_SHOT_IMAGE_CACHE_MAX_BYTES:
+            break
+        if path == keep_path:
+            continue
+        for cached_file in (path, f"{path}.etag"):
+            try:
+                os.remove(cached_file)
+            except OSError:
+                pass
+        total_bytes -= size
+
+
+def _get_s3_image_content(s3_uri: str) -> bytes:
+    """
+    Read an example image from S3, reusing the local copy while it is current.
+
+    A cached copy is revalidated with a conditional GetObject (IfNoneMatch), so
+    an unchanged image costs one round trip and no transfer. The cache is kept
+    under FEW_SHOT_IMAGE_CACHE_MAX_BYTES by evicting least recently used images.
+
+    Args:
+        s3_uri: S3 URI of the image
+
+    Returns:
+        Image bytes
+    """
+    cache_path = os.path.join(
+        FEW_SHOT_IMAGE_CACHE_DIR, hashlib.sha256(s3_uri.encode()).hexdigest()
+    )
+    etag_path = f"{cache_path}.etag"
+
+    cached_etag = None
+    try:
+        with open(etag_path, "r") as f:
+            cached_etag = f.read().strip() or None
+    except OSError:
+        pass
+
+    bucket, key = parse_s3_uri(s3_uri)
+    request = {"Bucket": bucket, "Key": key}
+    if cached_etag and os.path.exists(cache_path):
+        request["IfNoneMatch"] = cached_etag
+
+    try:
+        response = s3.get_s3_client().get_object(**request)
+    except ClientError as e:
+        error_code = e.response.get("Error", {}).get("Code")
+        if "IfNoneMatch" not in request or error_code not in ("304", "NotModified"):
+            raise
+        try:
+            with open(cache_path, "rb") as f:
+                content = f.read()
+            # Mark the image as recently used so eviction keeps it
+            os.utime(cache_path)
+            return content
+        except OSError:
+            # Evicted by another download since the check; fetch it again
+            del request["IfNoneMatch"]
+            response = s3.get_s3_client().get_object(**request)
+
+    content = response["Body"].read()
+    try:
+        # Write the image before its ETag so a reader never pairs a new ETag
+        # with old content; os.replace keeps each write atomic
+        os.makedirs(FEW_SHOT_IMAGE_CACHE_DIR, exist_ok=True)
+        for path, data, mode in (
+            (cache_path, content, "wb"),
+            (etag_path, response.get("ETag", ""), "w"),
+        ):
+            fd, temp_path = tempfile.mkstemp(
+                dir=FEW_SHOT_IMAGE_CACHE_DIR, suffix=".tmp"
+            )
+            with os.fdopen(fd, mode) as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        _evict_cached_images(cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to cache example image {s3_uri}: {e}")
+
+    return content
+
+
+def _load_image_attachment(image_file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a single example image and prepare it as a Bedrock attachment.
+
+    Returns:
+        Image attachment, or None if the image could not be loaded
+    """
+    try:
+        # Load image content
+        if image_file_path.startswith("s3://"):
+            # Direct S3 URI
+            image_content = _get_s3_image_content(image_file_path)
+        else:
+            # Local file
+            with open(image_file_path, "rb") as f:
+                image_content = f.read()
+
+        # Prepare image content for Bedrock
+        return image.prepare_bedrock_image_attachment(image_content)
+
+    except Exception as e:
+        logger.warning(f"Failed to load image {image_file_path}: {e}")
+        return None
+
+
+def _list_example_images(image_path: str) -> Tuple[List[str], Optional[Exception]]:
+    """
+    List the image files of an example, capturing any error for the caller.
+    """
+    try:
+        return _get_image_files_from_path(image_path), None
+    except Exception as e:
+        return [], e
+
+
+def _build_examples_content(
+    examples: List[Tuple[str, Optional[str]]],
+) -> List[Dict[str, Any]]:
+    """
+    Build content items for (prompt, imagePath) pairs, in order.
+
+    Image paths are listed and images downloaded in parallel, so S3 round trips
+    overlap instead of running one after another.
+
+    Args:
+        examples: Prompt text and optional image path for each example
+
+    Returns:
+        List of content items containing text and image content for examples
+    """
+    image_paths = [image_path for _, image_path in examples if image_path]
+    if not image_paths:
+        return [{"text": prompt} for prompt, _ in examples]
+
+    # Create the shared S3 client up front; boto3 client creation is not thread-safe
+    s3.get_s3_client()
+
+    with ThreadPoolExecutor(max_workers=MAX_EXAMPLE_IMAGE_WORKERS) as executor:
+        # Examples sharing an image path are only listed once
+        unique_image_paths = list(dict.fromkeys(image_paths))
+        listings = dict(
+            zip(
+                unique_image_paths,
+                executor.map(_list_example_images, unique_image_paths),
+            )
+        )
+
+        # Report listing failures for the first affected example, as before
+        for image_path in unique_image_paths:
+            error = listings[image_path][1]
+            if error is not None:
+                raise ValueError(
+                    f"Failed to load example images from {image_path}: {error}"
+                )
+
+        image_files = [
+            image_file_path
+            for image_path in image_paths
+            for image_file_path in listings[image_path][0]
+        ]
+        attachments = executor.map(_load_image_attachment, image_files)
+
+    content = []
+    for prompt, image_path in examples:
+        content.append({"text": prompt})
+        if image_path:
+            for _ in listings[image_path][0]:
+                image_attachment = next(attachments)
+                if image_attachment is not None:
+                    content.append(image_attachment)
+
+    return content
+
+
 def build_few_shot_examples_content(config: IDPConfig) -> List[Dict[str, Any]]:
     """
     Build content items for few-shot examples from the configuration.
@@ -82,7 +293,7 @@ def build_few_shot_examples_content(config: IDPConfig) -> List[Dict[str, Any]]:
     Returns:
         List of content items containing text and image content for examples
     """
-    content = []
+    examples_to_build = []
     classes = config.classes or []
 
     for schema in classes:
@@ -98,46 +309,9 @@ def build_few_shot_examples_content(config: IDPConfig) -> List[Dict[str, Any]]:
                 )
                 continue
 
-            content.append({"text": class_prompt})
-
-            image_path = example.get("imagePath")
-            if image_path:
-                try:
-                    # Load image content from the path
-
-                    # Get list of image files from the path (supports directories/prefixes)
-                    image_files = _get_image_files_from_path(image_path)
-
-                    # Process each image file
-                    for image_file_path in image_files:
-                        try:
-                            # Load image content
-                            if image_file_path.startswith("s3://"):
-                                # Direct S3 URI
-                                image_content = s3.get_binary_content(image_file_path)
-                            else:
-                                # Local file
-                                with open(image_file_path, "rb") as f:
-                                    image_content = f.read()
-
-                            # Prepare image content for Bedrock
-                            image_attachment = image.prepare_bedrock_image_attachment(
-                                image_content
-                            )
-                            content.append(image_attachment)
-
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to load image {image_file_path}: {e}"
-                            )
-                            continue
-
-                except Exception as e:
-                    raise ValueError(
-                        f"Failed to load example images from {image_path}: {e}"
-                    )
+            examples_to_build.append((class_prompt, example.get("imagePath")))
 
-    return content
+    return _build_examples_content(examples_to_build)
 
 
 def build_few_shot_extraction_examples_content(
@@ -153,7 +327,7 @@ def build_few_shot_extraction_examples_content(
     Returns:
         List of content items containing text and image content for examples
     """
-    content = []
+    examples_to_build = []
 
     # Get examples from the schema
     examples = target_class.get(X_AWS_IDP_EXAMPLES, [])
@@ -169,39 +343,6 @@ def build_few_shot_extraction_examples_content(
             )
             continue
 
-        content.append({"text": attributes_prompt})
+        examples_to_build.append((attributes_prompt, example.get("imagePath")))
 
-        image_path = example.get("imagePath")
-        if image_path:
-            try:
-                # Get list of image files from the path (supports directories/prefixes)
-                image_files = _get_image_files_from_path(image_path)
-
-                # Process each image file
-                for image_file_path in image_files:
-                    try:
-                        # Load image content
-                        if image_file_path.startswith("s3://"):
-                            # Direct S3 URI
-                            image_content = s3.get_binary_content(image_file_path)
-                        else:
-                            # Local file
-                            with open(image_file_path, "rb") as f:
-                                image_content = f.read()
-
-                        # Prepare image content for Bedrock
-                        image_attachment = image.prepare_bedrock_image_attachment(
-                            image_content
-                        )
-                        content.append(image_attachment)
-
-                    except Exception as e:
-                        logger.warning(f"Failed to load image {image_file_path}: {e}")
-                        continue
-
-            except Exception as e:
-                raise ValueError(
-                    f"Failed to load example images from {image_path}: {e}"
-                )
-
-    return content
+    return _build_examples_content(examples_to_build)
@@ -73,3 +73,767 @@ class TestErrorAnalyzerTools:
 
         assert len(__all__) == 7
         assert set(__all__) == expected_tools
+
+
+@pytest.mark.unit
+class TestCloudWatchSearchHelpers:
+    """Test CloudWatch search helper functions."""
+
+    def test_concurrent_search_preserves_log_group_order(self):
+        """Test parallel log group searches return results in input order."""
+        from unittest.mock import patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        log_group_names = [f"/stack/lambda/Function{i}" for i in range(8)]
+
+        def fake_search(log_group_name, **kwargs):
+            return {"log_group": log_group_name, "events_found": 0, "events": []}
+
+        with patch.object(
+            cloudwatch_tool, "_search_cloudwatch_logs", side_effect=fake_search
+        ) as mock_search:
+            results = cloudwatch_tool._search_log_groups_concurrently(
+                log_group_names, filter_pattern="ERROR", max_events=5
+            )
+
+        assert [r["log_group"] for r in results] == log_group_names
+        assert mock_search.call_count == len(log_group_names)
+        mock_search.assert_any_call(
+            log_group_name=log_group_names[0], filter_pattern="ERROR", max_events=5
+        )
+
+    def test_concurrent_search_stops_after_event_threshold(self):
+        """Test pending log group searches are skipped once enough events are found."""
+        import time
+        from unittest.mock import patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        log_group_names = [f"/stack/lambda/Function{i}" for i in range(12)]
+
+        def fake_search(log_group_name, **kwargs):
+            if log_group_name == log_group_names[0]:
+                return {
+                    "log_group": log_group_name,
+                    "events_found": 5,
+                    "events": [{"message": "ERROR"}] * 5,
+                }
+            time.sleep(0.2)
+            return {"log_group": log_group_name, "events_found": 0, "events": []}
+
+        with patch.object(
+            cloudwatch_tool, "_search_cloudwatch_logs", side_effect=fake_search
+        ) as mock_search:
+            results = cloudwatch_tool._search_log_groups_concurrently(
+                log_group_names, stop_after_events=5, filter_pattern="ERROR"
+            )
+
+        assert [r["log_group"] for r in results] == log_group_names
+        assert results[0]["events_found"] == 5
+        assert mock_search.call_count < len(log_group_names)
+
+    def test_log_groups_ranked_by_failed_function(self):
+        """Test the failed function's log groups are searched before others."""
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        log_groups = [
+            {"name": "/stack/lambda/QueueSender"},
+            {"name": "/stack/lambda/ClassificationFunction"},
+            {"name": "/stack/lambda/ExtractionFunction"},
+            {"name": "/stack/lambda/OCRFunction"},
+        ]
+        function_map = {
+            "STACK-OCRFunction-abc123": "rid-1",
+            "STACK-ExtractionFunction-def456": "rid-2",
+        }
+
+        ranked = cloudwatch_tool._rank_log_groups(
+            log_groups, function_map, "STACK-ExtractionFunction-def456"
+        )
+
+        assert [lg["name"] for lg in ranked] == [
+            "/stack/lambda/ExtractionFunction",
+            "/stack/lambda/OCRFunction",
+            "/stack/lambda/QueueSender",
+            "/stack/lambda/ClassificationFunction",
+        ]
+
+    def test_identical_searches_reused_within_invocation(self):
+        """Test repeated searches in one tool invocation call CloudWatch once."""
+        from unittest.mock import patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        log_group_names = ["/stack/lambda/OCRFunction"] * 3
+
+        def fake_run(log_group_name, *args):
+            return {"log_group": log_group_name, "events_found": 0, "events": []}
+
+        with patch.object(
+            cloudwatch_tool, "_run_cloudwatch_search", side_effect=fake_run
+        ) as mock_run:
+            token = cloudwatch_tool._search_memo.set({})
+            try:
+                cloudwatch_tool._search_cloudwatch_logs(
+                    log_group_names[0], filter_pattern="ERROR", max_events=5
+                )
+                results = cloudwatch_tool._search_log_groups_concurrently(
+                    log_group_names, filter_pattern="ERROR", max_events=5
+                )
+            finally:
+                cloudwatch_tool._search_memo.reset(token)
+
+            assert len(results) == 3
+            assert mock_run.call_count == 1
+
+            # Outside an invocation nothing is memoized
+            cloudwatch_tool._search_cloudwatch_logs(log_group_names[0])
+            cloudwatch_tool._search_cloudwatch_logs(log_group_names[0])
+            assert mock_run.call_count == 3
+
+    def test_insights_error_counts_aggregate_by_group_and_time(self):
+        """Test the stats query is summed per log group and per time bucket."""
+        from datetime import datetime, timedelta
+        from unittest.mock import MagicMock, patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        def stats_row(bucket, log_group, matches):
+            return [
+                {"field": "bin(5m)", "value": bucket},
+                {"field": "@log", "value": f"123456789012:{log_group}"},
+                {"field": "matches", "value": str(matches)},
+            ]
+
+        mock_client = MagicMock()
+        mock_client.start_query.return_value = {"queryId": "query-1"}
+        mock_client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [
+                stats_row("2025-01-01 10:05:00.000", "/stack/lambda/OCR", 3),
+                stats_row("2025-01-01 10:00:00.000", "/stack/lambda/OCR", 2),
+                stats_row("2025-01-01 10:05:00.000", "/stack/lambda/Assess", 4),
+            ],
+        }
+
+        end_time = datetime(2025, 1, 1, 11, 0, 0)
+        with patch.object(
+            cloudwatch_tool, "_get_logs_client", return_value=mock_client
+        ):
+            counts = cloudwatch_tool._get_insights_error_counts(
+                ["/stack/lambda/OCR", "/stack/lambda/Assess", "/stack/lambda/Idle"],
+                "ERROR",
+                end_time - timedelta(hours=1),
+                end_time,
+            )
+
+        query_string = mock_client.start_query.call_args.kwargs["queryString"]
+        assert "stats count() as matches by bin(5m), @log" in query_string
+        assert counts["by_log_group"] == {
+            "/stack/lambda/OCR": 5,
+            "/stack/lambda/Assess": 4,
+            "/stack/lambda/Idle": 0,
+        }
+        assert counts["timeline"] == [
+            {"time": "2025-01-01T10:00:00", "count": 2},
+            {"time": "2025-01-01T10:05:00", "count": 7},
+        ]
+
+    def test_stack_search_uses_filter_log_events_for_filter_syntax(self):
+        """Test patterns Insights cannot express skip the Insights queries."""
+        from datetime import datetime, timedelta
+        from unittest.mock import MagicMock, patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        literal = cloudwatch_tool._insights_literal
+        assert literal("ERROR") == "ERROR"
+        assert literal('"Task timed out"') == "Task timed out"
+        for pattern in [
+            "?ERROR ?Exception",
+            '{ $.level = "ERROR" }',
+            "[level=ERROR, ...]",
+            "-DEBUG",
+            "ERROR Timeout",
+        ]:
+            assert literal(pattern) is None
+
+        end_time = datetime(2025, 1, 1, 11, 0, 0)
+        assert (
+            cloudwatch_tool._get_insights_error_counts(
+                ["/stack/lambda/OCR"],
+                "?ERROR ?Exception",
+                end_time - timedelta(hours=1),
+                end_time,
+            )
+            is None
+        )
+
+        mock_client = MagicMock()
+        search_result = {
+            "log_group": "/stack/lambda/OCR",
+            "events_found": 1,
+            "events": [{"message": "Exception: boom"}],
+        }
+        with (
+            patch.object(cloudwatch_tool, "_get_stack_name", return_value="STACK"),
+            patch.object(
+                cloudwatch_tool,
+                "_get_log_group_prefix",
+                return_value={"log_group_prefix": "/stack"},
+            ),
+            patch.object(
+                cloudwatch_tool,
+                "_get_cloudwatch_log_groups",
+                return_value={
+                    "log_groups_found": 1,
+                    "log_groups": [{"name": "/stack/lambda/OCR"}],
+                },
+            ),
+            patch.object(cloudwatch_tool, "_get_logs_client", return_value=mock_client),
+            patch.object(
+                cloudwatch_tool,
+                "_search_log_groups_concurrently",
+                return_value=[search_result],
+            ) as mock_search,
+        ):
+            result = cloudwatch_tool._search_stack_logs("?ERROR ?Exception", 24, 5, 20)
+
+        mock_client.start_query.assert_not_called()
+        assert mock_search.call_args.kwargs["filter_pattern"] == "?ERROR ?Exception"
+        assert result["total_events_found"] == 1
+        assert "error_timeline" not in result
+        assert "total_matches" not in result["results"][0]
+
+    def test_filter_pattern_excludes_noise_server_side(self):
+        """Test plain-text filter patterns exclude noise terms in CloudWatch."""
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        assert (
+            cloudwatch_tool._build_filter_pattern("", request_id="rid-1")
+            == 'ERROR -"Processing event:" -Initialized -Starting'
+        )
+        assert (
+            cloudwatch_tool._build_filter_pattern("Exception")
+            == 'Exception -"Processing event:" -Initialized -Starting'
+        )
+        assert cloudwatch_tool._build_filter_pattern("") == ""
+        assert cloudwatch_tool._build_filter_pattern("[ERROR]") == "[ERROR]"
+        assert (
+            cloudwatch_tool._build_filter_pattern('{ $.level = "ERROR" }')
+            == '{ $.level = "ERROR" }'
+        )
+
+    def test_should_exclude_log_event(self):
+        """Test noise, system and oversized log lines are excluded."""
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        exclude = cloudwatch_tool._should_exclude_log_event
+
+        assert exclude("[ERROR] " + "x" * 1000)
+        assert exclude("  START RequestId: abc", filter_pattern="ERROR")
+        assert not exclude("  START RequestId: abc")
+        assert exclude("[ERROR] Processing event: {...}", filter_pattern="ERROR")
+        assert not exclude("[ERROR] Extraction failed", filter_pattern="ERROR")
+
+    def test_extract_prefix_from_state_machine_arn(self):
+        """Test log group prefixes are derived from state machine ARNs."""
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        extract = cloudwatch_tool._extract_prefix_from_state_machine_arn
+        arn_prefix = "arn:aws:states:us-east-1:123456789012:stateMachine:"
+
+        assert extract(f"{arn_prefix}IDP-PATTERN2-DocumentProcessingWorkflow") == (
+            "IDP-PATTERN2"
+        )
+        assert extract(f"{arn_prefix}IDP-PATTERN2-Workflow-AbC123") == (
+            "IDP-PATTERN2-Workflow"
+        )
+        assert extract(f"{arn_prefix}Workflow") == ""
+        assert extract("not-an-arn") == ""
+
+    def test_insights_search_limits_rows_per_log_group(self):
+        """Test each log group gets its own Logs Insights query and row limit."""
+        from datetime import datetime, timedelta
+        from unittest.mock import MagicMock, patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        def row(message):
+            return [
+                {"field": "@timestamp", "value": "2025-01-01 10:00:00.000"},
+                {"field": "@message", "value": message},
+                {"field": "@logStream", "value": "stream-1"},
+            ]
+
+        # The OCR log group is noisy, the Classification log group has one error
+        rows_by_log_group = {
+            "/stack/lambda/OCR": [row(f"[ERROR] Boom {i}") for i in range(20)],
+            "/stack/lambda/Classification": [row("[ERROR] Classify failed")],
+        }
+        mock_client = MagicMock()
+        mock_client.start_query.side_effect = lambda **kwargs: {
+            "queryId": kwargs["logGroupNames"][0]
+        }
+        mock_client.get_query_results.side_effect = lambda queryId: {
+            "status": "Complete",
+            "results": rows_by_log_group[queryId],
+        }
+
+        end_time = datetime(2025, 1, 1, 12, 0, 0)
+        with patch.object(
+            cloudwatch_tool, "_get_logs_client", return_value=mock_client
+        ):
+            results = cloudwatch_tool._search_log_groups_with_insights(
+                ["/stack/lambda/OCR", "/stack/lambda/Classification"],
+                filter_pattern="ERROR",
+                start_time=end_time - timedelta(hours=1),
+                end_time=end_time,
+                max_events=5,
+            )
+
+        assert mock_client.start_query.call_count == 2
+        for call in mock_client.start_query.call_args_list:
+            assert len(call.kwargs["logGroupNames"]) == 1
+            assert call.kwargs["queryString"].endswith("| limit 25")
+        assert [r["log_group"] for r in results] == [
+            "/stack/lambda/OCR",
+            "/stack/lambda/Classification",
+        ]
+        assert results[0]["events_found"] == 5
+        assert results[0]["events"][0] == {
+            "timestamp": "2025-01-01T10:00:00",
+            "message": "[ERROR] Boom 0",
+            "log_stream": "stream-1",
+        }
+        assert results[1]["events_found"] == 1
+        assert results[1]["events"][0]["message"] == "[ERROR] Classify failed"
+
+    def test_is_error_event_matches_indicators_case_insensitively(self):
+        """Test error indicator detection across casing variants."""
+        from idp_common.agents.error_analyzer.tools.cloudwatch_tool import (
+            _is_error_event,
+        )
+
+        assert _is_error_event("[ERROR] something broke")
+        assert _is_error_event("Task timed out: Timeout after 900s")
+        assert _is_error_event("botocore exception raised")
+        assert _is_error_event("critical failure")
+        assert not _is_error_event("[INFO] processing page 1")
+
+    def test_log_group_prefix_is_cached_per_stack(self):
+        """Test CloudFormation prefix lookups are reused across calls."""
+        from unittest.mock import MagicMock, patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        cloudwatch_tool._get_log_group_prefix.cache_clear()
+        mock_client = MagicMock()
+        mock_client.describe_stacks.return_value = {"Stacks": [{"Outputs": []}]}
+
+        with patch.object(
+            cloudwatch_tool, "_get_cloudformation_client", return_value=mock_client
+        ):
+            first = cloudwatch_tool._get_log_group_prefix("my-stack")
+            first["log_group_prefix"] = "mutated"
+            second = cloudwatch_tool._get_log_group_prefix("my-stack")
+
+        assert mock_client.describe_stacks.call_count == 1
+        assert second["log_group_prefix"] == "/aws/lambda/my-stack"
+        cloudwatch_tool._get_log_group_prefix.cache_clear()
+
+    def test_empty_log_group_listing_is_not_cached(self):
+        """Test empty log group discovery results are retried."""
+        from unittest.mock import MagicMock, patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        cloudwatch_tool._get_cloudwatch_log_groups.cache_clear()
+        mock_client = MagicMock()
+        mock_client.describe_log_groups.return_value = {"logGroups": []}
+
+        with patch.object(
+            cloudwatch_tool, "_get_logs_client", return_value=mock_client
+        ):
+            cloudwatch_tool._get_cloudwatch_log_groups(prefix="/my-stack/lambda")
+            cloudwatch_tool._get_cloudwatch_log_groups(prefix="/my-stack/lambda")
+
+        assert mock_client.describe_log_groups.call_count == 2
+        cloudwatch_tool._get_cloudwatch_log_groups.cache_clear()
+
+    def test_lambda_log_stream_prefix_for_single_day_window(self):
+        """Test log stream prefix is derived only for single-day windows."""
+        from datetime import datetime, timezone
+
+        from idp_common.agents.error_analyzer.tools.cloudwatch_tool import (
+            _get_lambda_log_stream_prefix,
+        )
+
+        start = datetime(2025, 3, 4, 10, 0, tzinfo=timezone.utc)
+        same_day_end = datetime(2025, 3, 4, 10, 5, tzinfo=timezone.utc)
+        next_day_end = datetime(2025, 3, 5, 0, 1, tzinfo=timezone.utc)
+
+        assert _get_lambda_log_stream_prefix(start, same_day_end) == "2025/03/04/"
+        assert _get_lambda_log_stream_prefix(start, next_day_end) == ""
+        assert _get_lambda_log_stream_prefix(None, same_day_end) == ""
+
+    def test_search_pages_past_empty_filter_log_events_pages(self):
+        """Test FilterLogEvents paging continues until matching events appear."""
+        from unittest.mock import MagicMock, patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        mock_client = MagicMock()
+        mock_client.get_paginator.return_value.paginate.return_value = iter(
+            [
+                {"events": []},
+                {
+                    "events": [
+                        {
+                            "timestamp": 1735725600000,
+                            "message": "[ERROR] Boom",
+                            "logStreamName": "stream-1",
+                        }
+                    ]
+                },
+                {"events": [{"timestamp": 1735725600000, "message": "[ERROR] 2"}]},
+            ]
+        )
+
+        with patch.object(
+            cloudwatch_tool, "_get_logs_client", return_value=mock_client
+        ):
+            result = cloudwatch_tool._search_cloudwatch_logs(
+                log_group_name="/stack/lambda/OCR", filter_pattern="ERROR", max_events=1
+            )
+
+        mock_client.get_paginator.assert_called_once_with("filter_log_events")
+        assert result["events_found"] == 1
+        assert result["events"][0]["message"] == "[ERROR] Boom"
+
+        # A sparse log group is given up on after a run of empty pages
+        pages_read = []
+
+        def sparse_pages():
+            for page_number in range(cloudwatch_tool.MAX_FILTER_LOG_EVENTS_PAGES):
+                pages_read.append(page_number)
+                yield {"events": []}
+
+        mock_client.get_paginator.return_value.paginate.return_value = sparse_pages()
+
+        with patch.object(
+            cloudwatch_tool, "_get_logs_client", return_value=mock_client
+        ):
+            result = cloudwatch_tool._search_cloudwatch_logs(
+                log_group_name="/stack/lambda/Sparse",
+                filter_pattern="ERROR",
+                max_events=1,
+            )
+
+        assert result["events_found"] == 0
+        assert len(pages_read) == cloudwatch_tool.MAX_EMPTY_FILTER_LOG_EVENTS_PAGES
+
+    def test_document_fallback_filters_errors_server_side(self):
+        """Test the document fallback pushes the error filter into Insights."""
+        from unittest.mock import MagicMock, patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        mock_client = MagicMock()
+        mock_client.start_query.return_value = {"queryId": "query-1"}
+        mock_client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [
+                [
+                    {"field": "@timestamp", "value": "2025-01-01 10:00:00.000"},
+                    {"field": "@message", "value": "[ERROR] report failed"},
+                    {"field": "@logStream", "value": "stream-1"},
+                    {"field": "@log", "value": "123456789012:/stack/lambda/OCR"},
+                ]
+            ],
+        }
+
+        with patch.object(
+            cloudwatch_tool, "_get_logs_client", return_value=mock_client
+        ):
+            result = cloudwatch_tool._search_by_document_fallback(
+                "report.pdf",
+                [{"name": "/stack/lambda/OCR"}, {"name": "/stack/lambda/Other"}],
+                {"start_time": None, "end_time": None},
+                max_log_events=5,
+            )
+
+        query_string = mock_client.start_query.call_args.kwargs["queryString"]
+        assert 'filter @message like "report"' in query_string
+        assert "(?i)ERROR|EXCEPTION|FAILED|TIMEOUT" in query_string
+        assert result["search_method_used"] == "document_specific_fallback"
+        assert result["total_events"] == 1
+        assert result["all_results"][0]["log_group"] == "/stack/lambda/OCR"
+
+    def test_document_fallback_filters_errors_case_insensitively(self):
+        """Test the FilterLogEvents fallback keeps only error messages."""
+        from unittest.mock import patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        events = [
+            {"message": "report processing Failed at page 2"},
+            {"message": "report read timeout"},
+            {"message": "report processed successfully"},
+        ]
+
+        with (
+            patch.object(
+                cloudwatch_tool,
+                "_search_log_groups_with_insights",
+                side_effect=RuntimeError("Insights unavailable"),
+            ),
+            patch.object(
+                cloudwatch_tool,
+                "_search_cloudwatch_logs",
+                return_value={"events_found": len(events), "events": events},
+            ),
+        ):
+            result = cloudwatch_tool._search_by_document_fallback(
+                "report.pdf",
+                [{"name": "/stack/lambda/OCR"}],
+                {"start_time": None, "end_time": None},
+                max_log_events=5,
+            )
+
+        assert result["total_events"] == 2
+        assert [e["message"] for e in result["all_results"][0]["events"]] == [
+            "report processing Failed at page 2",
+            "report read timeout",
+        ]
+
+    def test_failed_document_searches_failed_function_log_group_directly(self):
+        """Test failed documents skip log group discovery when errors are found."""
+        from unittest.mock import patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        function_name = "DEV-P2-PATTERN2STACK-1HHT2-OCRFunction-EQ6aqmcsC4XO"
+        context = {
+            "document_record": {"ObjectStatus": "FAILED"},
+            "xray_trace_id": "trace-1",
+            "lambda_function_to_request_id_map": {function_name: "rid-ocr"},
+        }
+        search_results = {
+            "all_results": [{"log_group": "ocr", "events_found": 1}],
+            "total_events": 1,
+            "search_method_used": "lambda_request_id",
+        }
+
+        with (
+            patch.object(
+                cloudwatch_tool, "_get_document_context", return_value=context
+            ),
+            patch.object(cloudwatch_tool, "_get_stack_name", return_value="STACK"),
+            patch.object(
+                cloudwatch_tool, "_search_by_request_ids", return_value=search_results
+            ) as mock_search,
+            patch.object(
+                cloudwatch_tool, "_get_log_groups_from_stack_prefix"
+            ) as mock_discovery,
+        ):
+            result = cloudwatch_tool._search_document_logs("report.pdf", "ERROR", 5, 20)
+
+        mock_discovery.assert_not_called()
+        assert mock_search.call_args.args[2] == [{"name": "/STACK/lambda/OCRFunction"}]
+        assert result["total_events_found"] == 1
+        assert (
+            cloudwatch_tool._get_function_log_group_name("STACK", "QueueSender-abc")
+            == ""
+        )
+
+    def test_failed_function_log_group_uses_resolved_stack_name(self):
+        """Test shortened function names still map to the stack's log group."""
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        # CloudFormation shortened the stack part of this generated name
+        function_name = "DEV-P2-EA8-PATTERN2STACK-1H-ClassificationFunction-a1B2c3"
+
+        assert (
+            cloudwatch_tool._get_function_log_group_name(
+                "DEV-P2-EA8-PATTERN2STACK-1HHT2VDXH7MW0", function_name
+            )
+            == "/DEV-P2-EA8-PATTERN2STACK-1HHT2VDXH7MW0/lambda/ClassificationFunction"
+        )
+
+    def test_request_id_search_queries_each_request_id_separately(self):
+        """Test request IDs get their own Insights query and priority is kept."""
+        from unittest.mock import MagicMock, patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        def row(message):
+            return [
+                {"field": "@timestamp", "value": "2025-01-01 10:00:00.000"},
+                {"field": "@message", "value": message},
+                {"field": "@logStream", "value": "stream-1"},
+            ]
+
+        rows_by_log_group = {
+            "/stack/lambda/OCRFunction": [row("[ERROR] rid-ocr OCR failed")],
+            "/stack/lambda/ClassificationFunction": [
+                row("[ERROR] rid-cls classify failed")
+            ],
+        }
+        mock_client = MagicMock()
+        mock_client.start_query.side_effect = lambda **kwargs: {
+            "queryId": kwargs["logGroupNames"][0]
+        }
+        mock_client.get_query_results.side_effect = lambda queryId: {
+            "status": "Complete",
+            "results": rows_by_log_group[queryId],
+        }
+
+        function_map = {
+            "STACK-ClassificationFunction-abc": "rid-cls",
+            "STACK-OCRFunction-def": "rid-ocr",
+        }
+        with patch.object(
+            cloudwatch_tool, "_get_logs_client", return_value=mock_client
+        ):
+            result = cloudwatch_tool._search_by_request_ids(
+                {"request_ids_to_search": ["rid-ocr", "rid-cls"]},
+                function_map,
+                [
+                    {"name": "/stack/lambda/OCRFunction"},
+                    {"name": "/stack/lambda/ClassificationFunction"},
+                ],
+                {"start_time": None, "end_time": None},
+                max_log_events=5,
+            )
+
+        # The failed function's request ID is found first, so rid-cls is never
+        # queried, and its query is capped at its own row limit
+        mock_client.start_query.assert_called_once()
+        query_string = mock_client.start_query.call_args.kwargs["queryString"]
+        assert '@message like "rid-ocr"' in query_string
+        assert "rid-cls" not in query_string
+        assert query_string.endswith("| limit 75")
+        assert result["search_method_used"] == "lambda_request_id"
+        assert result["total_events"] == 1
+        assert result["all_results"][0]["request_id"] == "rid-ocr"
+        assert result["all_results"][0]["log_group"] == "/stack/lambda/OCRFunction"
+
+    def test_request_id_search_falls_back_when_insights_finds_nothing(self):
+        """Test an empty Insights result is retried with FilterLogEvents."""
+        from unittest.mock import MagicMock, patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        mock_client = MagicMock()
+        mock_client.start_query.return_value = {"queryId": "query-1"}
+        mock_client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [],
+        }
+        search_result = {
+            "log_group": "/stack/lambda/OCRFunction",
+            "events_found": 1,
+            "events": [{"message": "[ERROR] rid-ocr OCR failed"}],
+        }
+
+        with (
+            patch.object(cloudwatch_tool, "_get_logs_client", return_value=mock_client),
+            patch.object(
+                cloudwatch_tool,
+                "_search_log_groups_concurrently",
+                return_value=[search_result],
+            ) as mock_search,
+        ):
+            result = cloudwatch_tool._search_by_request_ids(
+                {"request_ids_to_search": ["rid-ocr"]},
+                {"STACK-OCRFunction-def": "rid-ocr"},
+                [{"name": "/stack/lambda/OCRFunction"}],
+                {"start_time": None, "end_time": None},
+                max_log_events=5,
+            )
+
+        mock_client.start_query.assert_called_once()
+        assert mock_search.call_args.kwargs["request_id"] == "rid-ocr"
+        assert result["total_events"] == 1
+        assert result["all_results"][0]["request_id"] == "rid-ocr"
+
+    def test_processing_time_window_parses_utc_timestamps(self):
+        """Test tracking-table timestamps with a Z suffix are parsed as UTC."""
+        from datetime import datetime, timezone
+
+        from idp_common.agents.error_analyzer.tools.cloudwatch_tool import (
+            _get_processing_time_window,
+        )
+
+        window = _get_processing_time_window(
+            {
+                "InitialEventTime": "2025-01-01T10:00:00Z",
+                "CompletionTime": "2025-01-01T10:10:00+00:00",
+            }
+        )
+
+        assert window["start_time"] == datetime(2025, 1, 1, 9, 59, tzinfo=timezone.utc)
+        assert window["end_time"] == datetime(2025, 1, 1, 10, 11, tzinfo=timezone.utc)
+
+    def test_document_context_is_cached_unless_lookup_failed(self):
+        """Test document context lookups are reused but failures are retried."""
+        from unittest.mock import patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        cloudwatch_tool._get_document_context.cache_clear()
+        found = {"document_found": True, "document": {"ObjectStatus": "FAILED"}}
+        failed = {"error": "Throttled", "success": False, "document_found": False}
+
+        with patch.object(
+            cloudwatch_tool, "fetch_document_record", return_value=found
+        ) as mock_fetch:
+            cloudwatch_tool._get_document_context("report.pdf")
+            context = cloudwatch_tool._get_document_context("report.pdf")
+        assert mock_fetch.call_count == 1
+        assert context["document_record"] == {"ObjectStatus": "FAILED"}
+
+        with patch.object(
+            cloudwatch_tool, "fetch_document_record", return_value=failed
+        ) as mock_fetch:
+            cloudwatch_tool._get_document_context("other.pdf")
+            cloudwatch_tool._get_document_context("other.pdf")
+        assert mock_fetch.call_count == 2
+        cloudwatch_tool._get_document_context.cache_clear()
+
+    def test_document_context_is_not_cached_while_processing(self):
+        """Test in-progress documents are looked up again on every call."""
+        from unittest.mock import patch
+
+        from idp_common.agents.error_analyzer.tools import cloudwatch_tool
+
+        cloudwatch_tool._get_document_context.cache_clear()
+        running = {
+            "document_found": True,
+            "document": {"ObjectStatus": "EXTRACTING", "TraceId": "trace-1"},
+        }
+        not_found = {"document_found": False, "tracking_available": True}
+
+        with (
+            patch.object(
+                cloudwatch_tool, "fetch_document_record", return_value=running
+            ) as mock_fetch,
+            patch.object(
+                cloudwatch_tool,
+                "extract_lambda_request_ids",
+                return_value={"STACK-OCRFunction-abc": "rid-ocr"},
+            ),
+        ):
+            cloudwatch_tool._get_document_context("report.pdf")
+            cloudwatch_tool._get_document_context("report.pdf")
+        assert mock_fetch.call_count == 2
+
+        with patch.object(
+            cloudwatch_tool, "fetch_document_record", return_value=not_found
+        ) as mock_fetch:
+            cloudwatch_tool._get_document_context("missing.pdf")
+            cloudwatch_tool._get_document_context("missing.pdf")
+        assert mock_fetch.call_count == 1
+        cloudwatch_tool._get_document_context.cache_clear()
@@ -288,6 +288,40 @@ class TestBdaBlueprintService:
         # Should still update configuration despite partial failure
         service.config_manager.handle_update_custom_configuration.assert_called_once()
 
+    def test_update_existing_blueprint_transforms_schema_once(self, service):
+        """Test an updated class is transformed once for both the check and the update."""
+        custom_class = build_json_schema(
+            properties={"firstName": {"type": "string", "description": "First"}}
+        )
+        config_obj = MagicMock()
+        config_obj.classes = [custom_class]
+        service.config_manager.get_configuration.return_value = config_obj
+        existing_blueprint = {
+            "blueprintArn": "arn:aws:bedrock:us-west-2:123456789012:blueprint/w2",
+            "blueprintName": f"{service.blueprint_name_prefix}-{custom_class['$id']}",
+            "schema": json.dumps({"class": "outdated"}),
+        }
+        transform = service._transform_json_schema_to_bedrock_blueprint
+
+        with (
+            patch.object(
+                service, "_retrieve_all_blueprints", return_value=[existing_blueprint]
+            ),
+            patch.object(
+                service,
+                "_transform_json_schema_to_bedrock_blueprint",
+                wraps=transform,
+            ) as mock_transform,
+        ):
+            service.create_blueprints_from_custom_configuration()
+
+        mock_transform.assert_called_once_with(custom_class)
+        service.blueprint_creator.update_blueprint.assert_called_once_with(
+            blueprint_arn=existing_blueprint["blueprintArn"],
+            stage="LIVE",
+            schema=json.dumps(transform(custom_class)),
+        )
+
     def test_check_for_updates_no_changes(self, service):
         """Test _check_for_updates when no changes are detected."""
         properties = {
@@ -478,6 +512,35 @@ class TestBdaBlueprintService:
         )
         assert blueprint["properties"]["invoiceNumber"]["inferenceType"] == "inferred"
 
+    def test_transform_copies_nested_values(self, service):
+        """Nested values in the blueprint should not be shared with the input schema."""
+        schema = build_json_schema(
+            properties={
+                "lineItems": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["status"],
+                        "properties": {
+                            "status": {"type": "string", "enum": ["open", "paid"]}
+                        },
+                    },
+                }
+            },
+        )
+
+        blueprint = service._transform_json_schema_to_bedrock_blueprint(schema)
+        item = blueprint["properties"]["lineItems"]["items"]
+        item["required"].append("amount")
+        item["properties"]["status"]["enum"].append("void")
+
+        source_item = schema["properties"]["lineItems"]["items"]
+        assert source_item["required"] == ["status"]
+        assert source_item["properties"]["status"]["enum"] == ["open", "paid"]
+        assert item["properties"]["status"]["instruction"] == (
+            "Extract this field from the document"
+        )
+
     def test_transform_converts_defs_to_definitions(self, service):
         """Ensure that $defs is converted to definitions for BDA draft-07 compatibility.
 
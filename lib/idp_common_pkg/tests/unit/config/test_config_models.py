@@ -77,6 +77,15 @@ class TestConfigModels:
         assert config.top_k == 5.0
         assert config.max_tokens == 10000
 
+    def test_extraction_config_with_empty_and_integer_values(self):
+        """Test empty strings default to zero and ints are widened to float"""
+        config = ExtractionConfig.model_validate({"temperature": "", "top_k": 5})
+
+        assert config.temperature == 0.0
+        assert config.top_k == 5.0
+        assert isinstance(config.temperature, float)
+        assert isinstance(config.top_k, float)
+
     def test_full_config_with_mixed_types(self):
         """Test full IDPConfig with mixed type representations"""
         config_dict = {
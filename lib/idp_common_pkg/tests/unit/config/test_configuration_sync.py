@@ -248,6 +248,21 @@ class TestSyncCustomWithNewDefault:
         assert new_custom.assessment.temperature == 0.5
         assert new_custom.assessment.granular.enabled
 
+    def test_new_default_is_not_modified(self):
+        """Applying user customizations must not leak into the new Default."""
+        manager = ConfigurationManager(table_name="test-table")
+
+        old_default = IDPConfig(classes=[])
+        old_custom = IDPConfig(classes=[{"$id": "Invoice"}])
+        new_default = IDPConfig(classes=[{"$id": "Letter"}])
+
+        new_custom = manager.sync_custom_with_new_default(
+            old_default, new_default, old_custom
+        )
+
+        assert new_custom.classes == [{"$id": "Invoice"}]
+        assert new_default.classes == [{"$id": "Letter"}]
+
 
 @pytest.mark.unit
 class TestConfigurationManagerSync:
@@ -89,6 +89,16 @@ class TestDeepUpdate:
         # Result should not be affected
         assert result["b"] == [1, 2, 3]
 
+    def test_tuple_contents_are_deep_copied(self):
+        """Test that mutable values inside tuples are still copied."""
+        nested_list = [1, 2]
+        source = {"a": "text", "b": (nested_list,)}
+        result = deep_update({}, source)
+
+        nested_list.append(3)
+
+        assert result == {"a": "text", "b": ([1, 2],)}
+
 
 class TestGetDiffDict:
     """Test get_diff_dict function."""
@@ -228,6 +238,38 @@ class TestGetDiffDict:
         # Diff should not be affected
         assert diff["b"] == [1, 2, 3]
 
+    def test_shared_objects_are_not_diffed(self):
+        """Test identical objects are treated as unchanged."""
+        shared = {"prompt": "text", "items": [1, 2]}
+        base = {"config": shared, "list": shared["items"]}
+        modified = {"config": shared, "list": shared["items"], "new": 1}
+
+        assert get_diff_dict(base, base) == {}
+        assert get_diff_dict(base, modified) == {"new": 1}
+
+    def test_unchanged_nested_levels_are_pruned(self):
+        """Test nested dicts that only contain unchanged dicts are left out."""
+        base = {"a": {"b": {"c": 1}}, "d": {"e": 1}}
+        modified = {"a": {"b": {"c": 1}}, "d": {"e": 2}}
+
+        assert get_diff_dict(base, modified) == {"d": {"e": 2}}
+
+    def test_deeply_nested_dicts(self):
+        """Test nesting deeper than the recursion limit is handled."""
+        base, modified = {}, {}
+        base_level, modified_level = base, modified
+        for _ in range(2000):
+            base_level["child"] = {}
+            modified_level["child"] = {}
+            base_level, modified_level = base_level["child"], modified_level["child"]
+        modified_level["value"] = 1
+
+        diff = get_diff_dict(base, modified)
+
+        for _ in range(2000):
+            diff = diff["child"]
+        assert diff == {"value": 1}
+
     def test_diff_can_recreate_modified(self):
         """Test that applying diff to base recreates modified (except deletions)."""
         base = {"a": 1, "b": {"c": 2, "d": 3}, "e": 5}
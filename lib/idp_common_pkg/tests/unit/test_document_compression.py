@@ -232,6 +232,22 @@ class TestDocumentCompression:
         ):
             Document.from_compressed_or_dict(compressed_data)
 
+    def test_serialize_document_reuses_serialized_json(self):
+        """Test serialize_document stores the JSON it measured without re-serializing."""
+        with (
+            patch("boto3.client") as mock_boto3,
+            patch.object(Document, "to_json") as mock_to_json,
+        ):
+            mock_s3 = Mock()
+            mock_boto3.return_value = mock_s3
+
+            compressed_data = self.document.serialize_document(self.bucket, "ocr")
+
+            assert compressed_data["compressed"] is True
+            mock_to_json.assert_not_called()
+            stored_json = mock_s3.put_object.call_args.kwargs["Body"]
+            assert stored_json == json.dumps(self.document.to_dict(), default=str)
+
     def test_compress_error_handling(self):
         """Test compress method handles S3 errors gracefully."""
         with patch("boto3.client") as mock_boto3:
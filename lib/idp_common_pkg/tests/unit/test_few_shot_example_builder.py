@@ -0,0 +1,212 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the few-shot example builder.
+"""
+
+import io
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from idp_common.utils import few_shot_example_builder
+
+
+@pytest.mark.unit
+class TestBuildFewShotExtractionExamplesContent:
+    """Tests for build_few_shot_extraction_examples_content."""
+
+    @staticmethod
+    def _target_class(examples):
+        return {"x-aws-idp-examples": examples}
+
+    def test_images_follow_their_prompts_in_order(self):
+        """Test parallel image loading keeps each example's images in order."""
+        listings = {
+            "s3://bucket/examples/letter/": [
+                "s3://bucket/examples/letter/1.png",
+                "s3://bucket/examples/letter/2.png",
+            ],
+        }
+        target_class = self._target_class(
+            [
+                {
+                    "attributesPrompt": "Letter",
+                    "imagePath": "s3://bucket/examples/letter/",
+                },
+                {"attributesPrompt": "No image"},
+                {"attributesPrompt": "Memo", "imagePath": "s3://bucket/memo.jpg"},
+            ]
+        )
+
+        with (
+            patch.object(few_shot_example_builder.s3, "get_s3_client"),
+            patch.object(
+                few_shot_example_builder.s3,
+                "list_images_from_path",
+                side_effect=listings.__getitem__,
+            ),
+            patch.object(
+                few_shot_example_builder,
+                "_get_s3_image_content",
+                side_effect=lambda uri: uri.encode(),
+            ),
+            patch.object(
+                few_shot_example_builder.image,
+                "prepare_bedrock_image_attachment",
+                side_effect=lambda content: {"image": content.decode()},
+            ),
+        ):
+            content = (
+                few_shot_example_builder.build_few_shot_extraction_examples_content(
+                    target_class
+                )
+            )
+
+        assert content == [
+            {"text": "Letter"},
+            {"image": "s3://bucket/examples/letter/1.png"},
+            {"image": "s3://bucket/examples/letter/2.png"},
+            {"text": "No image"},
+            {"text": "Memo"},
+            {"image": "s3://bucket/memo.jpg"},
+        ]
+
+    def test_failed_image_is_skipped(self):
+        """Test an image that cannot be downloaded is left out."""
+
+        def fake_get_s3_image_content(uri):
+            if uri.endswith("bad.png"):
+                raise RuntimeError("AccessDenied")
+            return b"ok"
+
+        target_class = self._target_class(
+            [
+                {"attributesPrompt": "Bad", "imagePath": "s3://bucket/bad.png"},
+                {"attributesPrompt": "Good", "imagePath": "s3://bucket/good.png"},
+            ]
+        )
+
+        with (
+            patch.object(few_shot_example_builder.s3, "get_s3_client"),
+            patch.object(
+                few_shot_example_builder,
+                "_get_s3_image_content",
+                side_effect=fake_get_s3_image_content,
+            ),
+            patch.object(
+                few_shot_example_builder.image,
+                "prepare_bedrock_image_attachment",
+                return_value={"image": "ok"},
+            ),
+        ):
+            content = (
+                few_shot_example_builder.build_few_shot_extraction_examples_content(
+                    target_class
+                )
+            )
+
+        assert content == [{"text": "Bad"}, {"text": "Good"}, {"image": "ok"}]
+
+    def test_listing_failure_raises_value_error(self):
+        """Test a failure to list an example's images is reported."""
+        target_class = self._target_class(
+            [{"attributesPrompt": "Letter", "imagePath": "s3://bucket/examples/"}]
+        )
+
+        with (
+            patch.object(few_shot_example_builder.s3, "get_s3_client"),
+            patch.object(
+                few_shot_example_builder.s3,
+                "list_images_from_path",
+                side_effect=RuntimeError("NoSuchBucket"),
+            ),
+        ):
+            with pytest.raises(ValueError, match="s3://bucket/examples/"):
+                few_shot_example_builder.build_few_shot_extraction_examples_content(
+                    target_class
+                )
+
+
+@pytest.mark.unit
+class TestGetImageFilesFromPath:
+    """Tests for resolving example image paths."""
+
+    def test_image_suffix_is_matched_case_insensitively(self):
+        """Test an upper-case image suffix names a single file."""
+        with patch.object(
+            few_shot_example_builder.s3, "list_images_from_path"
+        ) as mock_list:
+            files = few_shot_example_builder._get_image_files_from_path(
+                "s3://bucket/examples/Letter.PNG"
+            )
+
+        assert files == ["s3://bucket/examples/Letter.PNG"]
+        mock_list.assert_not_called()
+
+
+@pytest.mark.unit
+class TestGetS3ImageContent:
+    """Tests for the local example image cache."""
+
+    def test_unchanged_image_served_from_cache(self, tmp_path):
+        """Test a cached image is revalidated by ETag instead of re-downloaded."""
+        mock_client = MagicMock()
+        mock_client.get_object.side_effect = [
+            {"Body": io.BytesIO(b"image-bytes"), "ETag": '"etag-1"'},
+            ClientError({"Error": {"Code": "304"}}, "GetObject"),
+        ]
+
+        with (
+            patch.object(
+                few_shot_example_builder, "FEW_SHOT_IMAGE_CACHE_DIR", str(tmp_path)
+            ),
+            patch.object(
+                few_shot_example_builder.s3, "get_s3_client", return_value=mock_client
+            ),
+        ):
+            first = few_shot_example_builder._get_s3_image_content(
+                "s3://bucket/examples/1.png"
+            )
+            second = few_shot_example_builder._get_s3_image_content(
+                "s3://bucket/examples/1.png"
+            )
+
+        assert first == second == b"image-bytes"
+        assert "IfNoneMatch" not in mock_client.get_object.call_args_list[0].kwargs
+        assert (
+            mock_client.get_object.call_args_list[1].kwargs["IfNoneMatch"] == '"etag-1"'
+        )
+
+    def test_least_recently_used_images_evicted_past_size_limit(self, tmp_path):
+        """Test writing past the size limit evicts the oldest image and its ETag."""
+        mock_client = MagicMock()
+        mock_client.get_object.side_effect = [
+            {"Body": io.BytesIO(b"first!"), "ETag": '"etag-1"'},
+            {"Body": io.BytesIO(b"second"), "ETag": '"etag-2"'},
+        ]
+
+        with (
+            patch.object(
+                few_shot_example_builder, "FEW_SHOT_IMAGE_CACHE_DIR", str(tmp_path)
+            ),
+            patch.object(
+                few_shot_example_builder, "FEW_SHOT_IMAGE_CACHE_MAX_BYTES", 10
+            ),
+            patch.object(
+                few_shot_example_builder.s3, "get_s3_client", return_value=mock_client
+            ),
+        ):
+            few_shot_example_builder._get_s3_image_content("s3://bucket/examples/1.png")
+            # Age the first image so it is the least recently used
+            (first_image,) = [p for p in tmp_path.iterdir() if p.suffix != ".etag"]
+            os.utime(first_image, (0, 0))
+            second = few_shot_example_builder._get_s3_image_content(
+                "s3://bucket/examples/2.png"
+            )
+
+        assert second == b"second"
+        remaining = sorted(p.read_bytes() for p in tmp_path.iterdir())
+        assert remaining == [b'"etag-2"', b"second"]
@@ -41,12 +41,29 @@ THROTTLING_EXCEPTIONS = [
     "RequestLimitExceeded"
 ]
 
-# Configuration will be loaded in handler function
-
 logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
 
+# Initialize settings
+WORKING_BUCKET = os.environ.get('WORKING_BUCKET')
+
+# Configuration is cached across warm invocations and reloaded after this many seconds
+CONFIG_CACHE_TTL_SECONDS = int(os.environ.get('CONFIG_CACHE_TTL_SECONDS', 60))
+_config = None
+_config_loaded_at = 0.0
+
+def get_cached_config():
+    """
+    Return the configuration model, reloading it once CONFIG_CACHE_TTL_SECONDS have passed.
+    """
+    global _config, _config_loaded_at
+    now = time.monotonic()
+    if _config is None or now - _config_loaded_at >= CONFIG_CACHE_TTL_SECONDS:
+        _config = get_config(as_model=True)
+        _config_loaded_at = now
+    return _config
+
 def is_throttling_exception(exception):
     """
     Check if an exception is related to throttling.
@@ -99,12 +116,15 @@ def handler(event, context):
     using the Assessment service from the idp_common library.
     """
     start_time = time.time()  # Capture start time for Lambda metering
-    logger.info(f"Starting assessment processing for event: {json.dumps(event, default=str)}")
+    logger.info("Starting assessment processing for event keys: %s", list(event))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event: %s", json.dumps(event, default=str))
 
     # Load configuration
-    config = get_config(as_model=True)
+    config = get_cached_config()
     # Use default=str to handle Decimal and other non-serializable types
-    logger.info(f"Config: {json.dumps(config.model_dump(), default=str)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Config: %s", json.dumps(config.model_dump(), default=str))
     
     # Extract input from event - handle both compressed and uncompressed
     document_data = event.get('document', {})
@@ -118,8 +138,7 @@ def handler(event, context):
         raise ValueError("No section_id provided in event")
         
     # Convert document data to Document object - handle compression
-    working_bucket = os.environ.get('WORKING_BUCKET')
-    document = Document.load_document(document_data, working_bucket, logger)
+    document = Document.load_document(document_data, WORKING_BUCKET, logger)
     logger.info(f"Processing assessment for document {document.id}, section {section_id}")
 
     # X-Ray annotations
@@ -172,9 +191,11 @@ def handler(event, context):
                 )
                 
                 # Add only the pages needed for this section
-                for page_id in section.page_ids:
-                    if page_id in document.pages:
-                        section_document.pages[page_id] = document.pages[page_id]
+                section_document.pages = {
+                    page_id: document.pages[page_id]
+                    for page_id in section.page_ids
+                    if page_id in document.pages
+                }
                 
                 # Add only the section being processed (preserve existing data)
                 section_document.sections = [section]
@@ -189,10 +210,11 @@ def handler(event, context):
                 # Return consistent format for Map state collation
                 response = {
                     "section_id": section_id, 
-                    "document": section_document.serialize_document(working_bucket, f"assessment_skip_{section_id}", logger)
+                    "document": section_document.serialize_document(WORKING_BUCKET, f"assessment_skip_{section_id}", logger)
                 }
                 
-                logger.info(f"Assessment skipped - Response: {json.dumps(response, default=str)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Assessment skipped - Response: %s", json.dumps(response, default=str))
                 return response
             else:
                 logger.info(f"Assessment needed for section {section_id} - no explainability_info found in extraction results")
@@ -318,7 +340,7 @@ def handler(event, context):
 
     # Prepare output with automatic compression if needed
     result = {
-        'document': updated_document.serialize_document(working_bucket, f"assessment_{section_id}", logger),
+        'document': updated_document.serialize_document(WORKING_BUCKET, f"assessment_{section_id}", logger),
         'section_id': section_id
     }
     
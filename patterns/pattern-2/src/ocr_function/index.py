@@ -19,8 +19,6 @@ from aws_xray_sdk.core import xray_recorder, patch_all
 
 patch_all()
 
-# Configuration will be loaded in handler function
-
 logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
@@ -29,6 +27,23 @@ logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_
 region = os.environ['AWS_REGION']
 METRIC_NAMESPACE = os.environ.get('METRIC_NAMESPACE')
 MAX_WORKERS = int(os.environ.get('MAX_WORKERS', 20))
+WORKING_BUCKET = os.environ.get('WORKING_BUCKET')
+
+# Configuration is cached across warm invocations and reloaded after this many seconds
+CONFIG_CACHE_TTL_SECONDS = int(os.environ.get('CONFIG_CACHE_TTL_SECONDS', 60))
+_config = None
+_config_loaded_at = 0.0
+
+def get_cached_config():
+    """
+    Return the configuration model, reloading it once CONFIG_CACHE_TTL_SECONDS have passed.
+    """
+    global _config, _config_loaded_at
+    now = time.monotonic()
+    if _config is None or now - _config_loaded_at >= CONFIG_CACHE_TTL_SECONDS:
+        _config = get_config(as_model=True)
+        _config_loaded_at = now
+    return _config
 
 @xray_recorder.capture('ocr_function')
 def handler(event, context): 
@@ -36,18 +51,20 @@ def handler(event, context):
     Lambda handler for OCR processing.
     """
     start_time = time.time()  # Capture start time for Lambda metering
-    logger.info(f"Event: {json.dumps(event)}")
+    logger.info("Event keys: %s", list(event))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event: %s", json.dumps(event))
     
     # Get document from event - handle both compressed and uncompressed
-    working_bucket = os.environ.get('WORKING_BUCKET')
-    document = Document.load_document(event["document"], working_bucket, logger)
+    document = Document.load_document(event["document"], WORKING_BUCKET, logger)
     
     # Log loaded document for troubleshooting
     logger.info(f"Loaded document - ID: {document.id}, input_key: {document.input_key}")
     logger.info(f"Document buckets - input_bucket: {document.input_bucket}, output_bucket: {document.output_bucket}")
     logger.info(f"Document status: {document.status}, num_pages: {document.num_pages}")
     logger.info(f"Document pages count: {len(document.pages)}, sections count: {len(document.sections)}")
-    logger.info(f"Full document content: {json.dumps(document.to_dict(), default=str)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Full document content: %s", json.dumps(document.to_dict(), default=str))
     
     # X-Ray annotations
     xray_recorder.put_annotation('document_id', {document.id})
@@ -79,12 +96,12 @@ def handler(event, context):
             logger.warning(f"Failed to add Lambda metering for OCR skip: {str(e)}")
         
         # Prepare output with existing document data
-        working_bucket = os.environ.get('WORKING_BUCKET')
         response = {
-            "document": document.serialize_document(working_bucket, "ocr_skip", logger)
+            "document": document.serialize_document(WORKING_BUCKET, "ocr_skip", logger)
         }
         
-        logger.info(f"OCR skipped - Response: {json.dumps(response, default=str)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("OCR skipped - Response: %s", json.dumps(response, default=str))
         return response
     
     # Normal OCR processing
@@ -98,7 +115,7 @@ def handler(event, context):
     t0 = time.time()
     
     # Load configuration and initialize the OCR service using new simplified pattern
-    config = get_config(as_model=True)
+    config = get_cached_config()
     backend = config.ocr.backend
     
     logger.info(f"Initializing OCR with backend: {backend}")
@@ -130,10 +147,10 @@ def handler(event, context):
         logger.warning(f"Failed to add Lambda metering for OCR: {str(e)}")
     
     # Prepare output with automatic compression if needed
-    working_bucket = os.environ.get('WORKING_BUCKET')
     response = {
-        "document": document.serialize_document(working_bucket, "ocr", logger)
+        "document": document.serialize_document(WORKING_BUCKET, "ocr", logger)
     }
     
-    logger.info(f"Response: {json.dumps(response, default=str)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response: %s", json.dumps(response, default=str))
     return response
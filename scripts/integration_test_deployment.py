@@ -5,12 +5,22 @@ Integration Test Deployment Script
 Handles code packaging, S3 upload, and pipeline monitoring for integration tests.
 """
 
+import fnmatch
+import functools
 import os
+import re
 import subprocess
 import sys
 import time
+import uuid
+import zipfile
 
 import boto3
+from boto3.s3.transfer import MB, TransferConfig
+
+# Bounds in seconds for polling a pipeline execution's status
+MIN_POLL_INTERVAL = 5
+MAX_POLL_INTERVAL = 60
 
 
 def run_command(cmd, check=True):
@@ -32,6 +42,12 @@ def get_env_var(name, default=None):
     return value
 
 
+@functools.cache
+def get_client(service_name):
+    """Get a boto3 client, shared by every step of the run"""
+    return boto3.client(service_name)
+
+
 def create_deployment_package():
     """Create deployment zip package"""
     print("Creating deployment package...")
@@ -65,10 +81,42 @@ def create_deployment_package():
         "*.aws-sam/*",
     ]
 
-    exclude_args = " ".join([f'-x "{pattern}"' for pattern in excludes])
-    cmd = f"zip -r ./dist/code.zip ./ {exclude_args}"
+    # Same wildcard semantics as zip -x: "*" also matches "/" in the
+    # archive path, so one compiled regex covers every pattern
+    exclude_re = re.compile("|".join(fnmatch.translate(p) for p in excludes))
+    # A pattern ending in "*" that matches "dir/" matches everything below it,
+    # so those directories are pruned instead of walked
+    prune_re = re.compile(
+        "|".join(fnmatch.translate(p) for p in excludes if p.endswith("*"))
+    )
+
+    try:
+        with zipfile.ZipFile(
+            "./dist/code.zip", "w", compression=zipfile.ZIP_DEFLATED
+        ) as zf:
+            # zip -r follows symlinks by default
+            for root, dirs, files in os.walk(".", followlinks=True):
+                rel_root = os.path.relpath(root, ".")
+                prefix = "" if rel_root == "." else f"{rel_root}/"
+                kept_dirs = []
+                for name in sorted(dirs):
+                    arcname = f"{prefix}{name}/"
+                    if prune_re.match(arcname):
+                        continue
+                    kept_dirs.append(name)
+                    if not exclude_re.match(arcname):
+                        zf.write(os.path.join(root, name), arcname)
+                dirs[:] = kept_dirs
+                for name in sorted(files):
+                    arcname = f"{prefix}{name}"
+                    path = os.path.join(root, name)
+                    if exclude_re.match(arcname) or not os.path.isfile(path):
+                        continue
+                    zf.write(path, arcname)
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
-    run_command(cmd)
     print("✅ Deployment package created")
 
 
@@ -76,7 +124,7 @@ def upload_to_s3(bucket_name):
     """Upload code package to S3 and return version ID"""
     print(f"Uploading to S3 bucket: {bucket_name}")
 
-    s3_client = boto3.client("s3")
+    s3_client = get_client("s3")
 
     try:
         # Get GitLab user email to pass to CodeBuild
@@ -88,12 +136,26 @@ def upload_to_s3(bucket_name):
             metadata["gitlab-user-email"] = gitlab_user_email
             print(f"Adding GitLab user email to metadata: {gitlab_user_email}")
 
-        response = s3_client.put_object(
-            Bucket=bucket_name,
-            Key="deploy/code.zip",
-            Body=open("./dist/code.zip", "rb"),
-            Metadata=metadata,
+        # Tag this upload so the version read back below is known to be ours
+        upload_id = uuid.uuid4().hex
+        metadata["upload-id"] = upload_id
+
+        # upload_file switches to concurrent multipart uploads for large packages
+        s3_client.upload_file(
+            "./dist/code.zip",
+            bucket_name,
+            "deploy/code.zip",
+            ExtraArgs={"Metadata": metadata},
+            Config=TransferConfig(
+                multipart_threshold=8 * MB,
+                multipart_chunksize=8 * MB,
+                max_concurrency=10,
+            ),
         )
+        # upload_file does not return the version, so read it back
+        response = s3_client.head_object(Bucket=bucket_name, Key="deploy/code.zip")
+        if response.get("Metadata", {}).get("upload-id") != upload_id:
+            raise RuntimeError("deploy/code.zip was overwritten by another upload")
         version_id = response.get("VersionId", "unknown")
         print(f"✅ Uploaded with version ID: {version_id}")
         return version_id
@@ -106,7 +168,7 @@ def find_pipeline_execution_by_version(pipeline_name, version_id, max_wait=300):
     """Find pipeline execution that corresponds to specific S3 version ID"""
     print(f"Finding pipeline execution for version: {version_id}")
     
-    codepipeline = boto3.client("codepipeline")
+    codepipeline = get_client("codepipeline")
     start_time = time.time()
     
     while time.time() - start_time < max_wait:
@@ -143,11 +205,13 @@ def monitor_pipeline_execution(pipeline_name, execution_id, max_wait=7200):
     """Monitor specific pipeline execution until completion"""
     print(f"Monitoring execution: {execution_id}")
     
-    codepipeline = boto3.client("codepipeline")
-    wait_time = 0
-    poll_interval = 30
+    codepipeline = get_client("codepipeline")
+    start_time = time.monotonic()
+    # Poll quickly at first and back off while the status stays the same
+    poll_interval = MIN_POLL_INTERVAL
+    previous_status = None
     
-    while wait_time < max_wait:
+    while time.monotonic() - start_time < max_wait:
         try:
             response = codepipeline.get_pipeline_execution(
                 pipelineName=pipeline_name,
@@ -164,13 +228,19 @@ def monitor_pipeline_execution(pipeline_name, execution_id, max_wait=7200):
                 print(f"❌ Pipeline failed with status: {status}")
                 return False
             elif status == "InProgress":
-                print(f"⏳ Pipeline still running... ({wait_time}s elapsed)")
+                elapsed = int(time.monotonic() - start_time)
+                print(f"⏳ Pipeline still running... ({elapsed}s elapsed)")
+
+            if status == previous_status:
+                poll_interval = min(poll_interval * 1.5, MAX_POLL_INTERVAL)
+            else:
+                poll_interval = MIN_POLL_INTERVAL
+            previous_status = status
                 
         except Exception as e:
             print(f"Error checking pipeline status: {e}")
             
         time.sleep(poll_interval)
-        wait_time += poll_interval
     
     print(f"❌ Pipeline monitoring timed out after {max_wait} seconds")
     return False